@@ -18,13 +18,15 @@ class MarketOperations:
     
     def __init__(self, config: BotConfig, screen_capture: ScreenCapture,
                  template_manager: TemplateManager, bot_state: BotState,
-                 log_callback: Callable[[str], None], safe_click_callback: Callable[[int, int, str], bool]):
+                 log_callback: Callable[[str], None], safe_click_callback: Callable[[int, int, str], bool],
+                 safe_click_burst_callback: Optional[Callable[[int, int, int], bool]] = None):
         self.config = config
         self.screen_capture = screen_capture
         self.template_manager = template_manager
         self.bot_state = bot_state
         self.log = log_callback
         self.safe_click = safe_click_callback
+        self.safe_click_burst = safe_click_burst_callback
     
     def check_silo_full_template(self, screen: np.ndarray) -> bool:
         """Check if silo is full using silo.png template"""
@@ -38,7 +40,7 @@ class MarketOperations:
     
     def close_silo_with_template(self, screen: np.ndarray) -> bool:
         """Close silo popup using close.png template"""
-        close_x, close_y, confidence = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
+        close_x, close_y, confidence = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD, roi=self.config.ROI_HINTS['close'])
         if close_x and close_y:
             self.log(f"🔲 Closing silo popup via template (confidence: {confidence:.2f}) - keeping silo full state")
             self.safe_click(close_x, close_y, "close button")
@@ -56,16 +58,28 @@ class MarketOperations:
             self.log("🔄 Loading screen dismissed before market button search")
             screen = self.screen_capture.capture_screen(use_cache=False)
         
-        market_x, market_y, confidence = self.template_manager.find_template(screen, 'market_button', threshold=self.config.MARKET_BUTTON_THRESHOLD)
+        market_x, market_y, confidence = self.template_manager.find_template(screen, 'market_button', threshold=self.config.MARKET_BUTTON_THRESHOLD, roi=self.config.ROI_HINTS['market_button'])
         if market_x and market_y:
             self.log(f"🏪 Going to market via template (confidence: {confidence:.2f})")
             self.safe_click(market_x, market_y, "market button")
             
-            # Wait for market to load and verify we actually entered
+            # Wait for market to load and verify we actually entered.
+            # Adaptive backoff: poll quickly at first, slow down if the UI
+            # still hasn't settled.
+            last_hash = self.screen_capture.frame_hash(screen)
+            delay = 0.1
             for attempt in range(5):
-                time.sleep(0.5)
+                time.sleep(delay)
+                delay = min(delay * 1.7, 0.5)
                 screen = self.screen_capture.capture_screen(use_cache=False)
-                
+
+                # Skip the template cascade when the frame hasn't changed
+                current_hash = self.screen_capture.frame_hash(screen)
+                if current_hash == last_hash:
+                    self.log(f"⏳ Screen unchanged, still waiting for market... attempt {attempt+1}/5")
+                    continue
+                last_hash = current_hash
+
                 # Check for loading screen during market loading
                 if self._check_and_dismiss_loading_screen_with_click(screen):
                     self.log("🔄 Loading screen dismissed during market loading")
@@ -130,8 +144,9 @@ class MarketOperations:
                 collected_this_round = True
                 total_collected += 1
             
-            # Check for sold items
-            screen = self.screen_capture.capture_screen(use_cache=False)
+            # Check for sold items - only re-grab if the collect click changed the screen
+            if collected_this_round:
+                screen = self.screen_capture.capture_screen(use_cache=False)
             sold_x, sold_y, confidence = self.template_manager.find_template(screen, 'sold', threshold=self.config.SOLD_ITEMS_THRESHOLD)
             if sold_x and sold_y:
                 self.log(f"💸 Collecting sold items (confidence: {confidence:.2f})")
@@ -163,7 +178,7 @@ class MarketOperations:
         screen = self.screen_capture.capture_screen(use_cache=False)
         if not self.check_wheat_availability(screen):
             self.log("🚫 No wheat available to sell - closing offer page")
-            close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
+            close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD, roi=self.config.ROI_HINTS['close'])
             if close_x and close_y:
                 self.log(f"🔲 Clicking close button to exit offer creation (confidence: {close_conf:.3f})")
                 self.safe_click(close_x, close_y, "close offer creation")
@@ -262,89 +277,107 @@ class MarketOperations:
         self.log(f"📝 Market filling completed. {slots_filled} slots filled.")
         return slots_filled > 0
     
-    def maximize_quantity_step(self) -> bool:
-        """Maximize quantity using plus_button"""
-        self.log("➕ Step 1: Maximizing wheat quantity...")
-        
+    def _roi_around(self, screen: np.ndarray, x: int, y: int, radius: int = 80) -> Tuple[float, float, float, float]:
+        """Fractional ROI box of +/- radius pixels around a known position"""
+        h, w = screen.shape[:2]
+        return (max(0.0, (y - radius) / h), min(1.0, (y + radius) / h),
+                max(0.0, (x - radius) / w), min(1.0, (x + radius) / w))
+
+    def _maximize_button_loop(self, active_name: str, deactive_name: str,
+                              active_threshold: float, deactive_threshold: float,
+                              roi: Tuple[float, float, float, float],
+                              done_message: str, click_label: str,
+                              burst: int = 1) -> bool:
+        """Click an active/deactive button pair until the deactive state wins
+
+        Both button states live in the same screen region, so the two lookups
+        share one grayscale conversion per frame, and once the button is
+        located the search narrows to a small box around it - the control
+        does not move between clicks.
+
+        With `burst` > 1 each round fires that many clicks before the next
+        capture-and-detect pass - the stepper consumes queued clicks and is
+        clamped at its maximum, so a few extra clicks past the limit are
+        harmless while the per-click detection round trip drops by the
+        burst factor.
+        """
+        # Adaptive backoff: re-check quickly right after a click, back off
+        # exponentially while the button state stays unclear
+        delay = 0.05
         for i in range(20):
-            time.sleep(self.config.MARKET_STEP_DELAY)
+            time.sleep(delay)
             screen = self.screen_capture.capture_screen(use_cache=False)
-            
+
             # Check button states
-            deactive_x, deactive_y, deactive_conf = self.template_manager.find_template(screen, 'plus_button_deactive', threshold=self.config.PLUS_BUTTON_DEACTIVE_THRESHOLD)
-            active_x, active_y, active_conf = self.template_manager.find_template(screen, 'plus_button_active', threshold=self.config.PLUS_BUTTON_ACTIVE_THRESHOLD)
-            
+            deactive_x, deactive_y, deactive_conf = self.template_manager.find_template(screen, deactive_name, threshold=deactive_threshold, roi=roi)
+            active_x, active_y, active_conf = self.template_manager.find_template(screen, active_name, threshold=active_threshold, roi=roi)
+
+            # Narrow future searches around the located button
+            found_x, found_y = (active_x, active_y) if active_x else (deactive_x, deactive_y)
+            if found_x and found_y:
+                roi = self._roi_around(screen, found_x, found_y)
+
             # If deactive confidence is high and clearly higher than active, we're done
-            if deactive_conf >= self.config.PLUS_BUTTON_DEACTIVE_THRESHOLD and deactive_conf > active_conf:
-                self.log(f"✅ Plus button is DEACTIVE - quantity maximized! (confidence: {deactive_conf:.2f})")
-                self.log("🔄 Moving to STEP 2: Price maximization...")
+            if deactive_conf >= deactive_threshold and deactive_conf > active_conf:
+                self.log(f"✅ {done_message} (confidence: {deactive_conf:.2f})")
                 return True
-            
+
             # If active confidence is high and clearly higher than deactive, click it
-            if active_conf >= self.config.PLUS_BUTTON_ACTIVE_THRESHOLD and active_conf > deactive_conf:
-                self.log(f"➕ Clicking ACTIVE plus button (confidence: {active_conf:.2f}) - attempt {i+1}")
-                self.safe_click(active_x, active_y, "plus button active")
+            if active_conf >= active_threshold and active_conf > deactive_conf:
+                self.log(f"🖱️ Clicking ACTIVE {click_label} (confidence: {active_conf:.2f}) - attempt {i+1}")
+                if burst > 1 and self.safe_click_burst is not None:
+                    self.safe_click_burst(active_x, active_y, burst,
+                                          description=f"{click_label} active")
+                else:
+                    self.safe_click(active_x, active_y, f"{click_label} active")
+                delay = 0.05  # UI just changed - re-check quickly
                 continue
-            
+
             # If we're getting mixed signals, try to determine which is which based on confidence
             if deactive_conf > 0.6 and deactive_conf > active_conf:
                 self.log(f"🔧 Deactive confidence higher ({deactive_conf:.3f} vs {active_conf:.3f}), assuming maximized")
                 return True
             elif active_conf > 0.6 and active_conf > deactive_conf:
                 self.log(f"🔧 Active confidence higher ({active_conf:.3f} vs {deactive_conf:.3f}), clicking button")
-                self.safe_click(active_x, active_y, "plus button active (higher confidence)")
+                self.safe_click(active_x, active_y, f"{click_label} active (higher confidence)")
+                delay = 0.05
                 continue
-            
-            # If no clear detection, wait and try again
+
+            # If no clear detection, back off and try again
             self.log(f"⚠️ Unclear button state (attempt {i+1}), waiting...")
-            time.sleep(self.config.MARKET_STEP_DELAY)
-        
-        self.log("⚠️ Could not determine plus button state after 20 attempts")
+            delay = min(delay * 1.7, self.config.MARKET_UI_WAIT)
+
+        self.log(f"⚠️ Could not determine {click_label} state after 20 attempts")
         return False
-    
+
+    def maximize_quantity_step(self) -> bool:
+        """Maximize quantity using plus_button"""
+        self.log("➕ Step 1: Maximizing wheat quantity...")
+        if self._maximize_button_loop(
+                'plus_button_active', 'plus_button_deactive',
+                self.config.PLUS_BUTTON_ACTIVE_THRESHOLD, self.config.PLUS_BUTTON_DEACTIVE_THRESHOLD,
+                self.config.ROI_HINTS['plus_button'],
+                "Plus button is DEACTIVE - quantity maximized!", "plus button",
+                burst=5):
+            self.log("🔄 Moving to STEP 2: Price maximization...")
+            return True
+        return False
+
     def maximize_price_step(self) -> bool:
         """Maximize price using arrow_right"""
         self.log("💰 Step 2: Maximizing price...")
-        
-        for i in range(20):
-            time.sleep(self.config.MARKET_STEP_DELAY)
-            screen = self.screen_capture.capture_screen(use_cache=False)
-            
-            # Check button states
-            deactive_x, deactive_y, deactive_conf = self.template_manager.find_template(screen, 'arrow_right_deactive', threshold=self.config.ARROW_BUTTON_DEACTIVE_THRESHOLD)
-            active_x, active_y, active_conf = self.template_manager.find_template(screen, 'arrow_right_active', threshold=self.config.ARROW_BUTTON_ACTIVE_THRESHOLD)
-            
-            # If deactive confidence is high and clearly higher than active, we're done
-            if deactive_conf >= self.config.ARROW_BUTTON_DEACTIVE_THRESHOLD and deactive_conf > active_conf:
-                self.log(f"✅ Arrow right is DEACTIVE - price maximized! (confidence: {deactive_conf:.2f})")
-                self.log("🔄 Both maximize steps completed! Moving to newspaper/insert...")
-                return True
-            
-            # If active confidence is high and clearly higher than deactive, click it
-            if active_conf >= self.config.ARROW_BUTTON_ACTIVE_THRESHOLD and active_conf > deactive_conf:
-                self.log(f"💰 Clicking ACTIVE arrow right (confidence: {active_conf:.2f}) - attempt {i+1}")
-                self.safe_click(active_x, active_y, "arrow right active")
-                continue
-            
-            # If we're getting mixed signals, try to determine which is which based on confidence
-            if deactive_conf > 0.6 and deactive_conf > active_conf:
-                self.log(f"🔧 Deactive confidence higher ({deactive_conf:.3f} vs {active_conf:.3f}), assuming maximized")
-                return True
-            elif active_conf > 0.6 and active_conf > deactive_conf:
-                self.log(f"🔧 Active confidence higher ({active_conf:.3f} vs {deactive_conf:.3f}), clicking button")
-                self.safe_click(active_x, active_y, "arrow right active (higher confidence)")
-                continue
-            
-            # If no clear detection, wait and try again
-            self.log(f"⚠️ Unclear button state (attempt {i+1}), waiting...")
-            time.sleep(self.config.MARKET_STEP_DELAY)
-        
-        self.log("⚠️ Could not determine arrow right state after 20 attempts")
+        if self._maximize_button_loop(
+                'arrow_right_active', 'arrow_right_deactive',
+                self.config.ARROW_BUTTON_ACTIVE_THRESHOLD, self.config.ARROW_BUTTON_DEACTIVE_THRESHOLD,
+                self.config.ROI_HINTS['arrow_button'],
+                "Arrow right is DEACTIVE - price maximized!", "arrow right"):
+            self.log("🔄 Both maximize steps completed! Moving to newspaper/insert...")
+            return True
         return False
     
     def close_market_template(self, screen: np.ndarray) -> bool:
         """Close market using close button template only"""
-        close_x, close_y, confidence = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
+        close_x, close_y, confidence = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD, roi=self.config.ROI_HINTS['close'])
         
         if close_x and close_y:
             self.log(f"🔲 Closing market via template (confidence: {confidence:.2f})")
@@ -365,8 +398,27 @@ class MarketOperations:
             self.log("⚠️ Close button template not found")
             return False
     
+    def _page_probe_ok(self, screen: np.ndarray, template_name: str) -> bool:
+        """O(1) pixel pre-check for a page template
+
+        Samples one configured pixel before paying for a full template
+        match; pages have fixed backdrops, so a wrong color at the probe
+        point means the page cannot be showing. Pages without a configured
+        probe always pass.
+        """
+        probe = self.config.PAGE_PROBE_PIXELS.get(template_name)
+        if probe is None:
+            return True
+        (x, y), bgr, tolerance = probe
+        if y >= screen.shape[0] or x >= screen.shape[1]:
+            return True
+        diff = int(np.abs(screen[y, x].astype(int) - np.asarray(bgr, dtype=int)).sum())
+        return diff <= tolerance
+
     def is_in_market(self, screen: np.ndarray) -> Tuple[bool, float]:
         """Check if we're currently in the market"""
+        if not self._page_probe_ok(screen, 'market'):
+            return False, 0.0
         x, y, confidence = self.template_manager.find_template(screen, 'market', threshold=self.config.MARKET_PAGE_THRESHOLD)
         return (x is not None and y is not None), confidence
     
@@ -375,13 +427,15 @@ class MarketOperations:
         self.log("🏪 Starting template-based market workflow...")
         
         screen = self.screen_capture.capture_screen(use_cache=False)
-        locations = self.analyze_current_location(screen)
-        
+        # Scan all workflow templates once at entry and reuse the results
+        entry_batch = self.scan_location_templates(screen)
+        locations = self.analyze_current_location(screen, batch=entry_batch)
+
         # Check current location and navigate appropriately
         if 'offer' in locations:
             self.log(f"📝 Currently in OFFER page (confidence: {locations['offer']:.2f}), returning to shop first...")
             # Close offer page to return to shop
-            close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
+            close_x, close_y, close_conf = entry_batch['close']
             if close_x and close_y:
                 self.safe_click(close_x, close_y, "close offer page")
                 time.sleep(0.5)
@@ -421,64 +475,72 @@ class MarketOperations:
         self.log("✅ Template-based market workflow completed")
         return True
     
-    def analyze_current_location(self, screen: np.ndarray) -> dict:
+    def scan_location_templates(self, screen: np.ndarray) -> dict:
+        """Run all location/navigation templates against one screen in a single batched pass"""
+        return self.template_manager.find_templates_batch(
+            screen,
+            ['main', 'in_offer', 'market', 'paper_page', 'silo', 'close'],
+            thresholds={
+                'main': self.config.MAIN_PAGE_THRESHOLD,
+                'in_offer': self.config.OFFER_PAGE_THRESHOLD,
+                'market': self.config.MARKET_PAGE_THRESHOLD,
+                'paper_page': self.config.PAPER_PAGE_THRESHOLD,
+                'silo': self.config.SILO_POPUP_THRESHOLD,
+                'close': self.config.CLOSE_BUTTON_THRESHOLD,
+            }
+        )
+
+    def analyze_current_location(self, screen: np.ndarray, batch: Optional[dict] = None) -> dict:
         """Analyze where we currently are and return location info with priority logic"""
-        confidences = {}
-        
-        # Get all detection confidences first
-        is_main, main_conf = self.is_on_main_page(screen)
-        confidences['main'] = main_conf
-        
-        in_offer, offer_conf = self.is_in_offer(screen)
-        confidences['offer'] = offer_conf
-        
-        in_market, market_conf = self.is_in_market(screen)
-        confidences['market'] = market_conf
-        
-        in_paper_page, paper_page_conf = self.is_in_paper_page(screen)
-        confidences['paper_page'] = paper_page_conf
-        
-        silo_x, silo_y, silo_conf = self.template_manager.find_template(screen, 'silo', threshold=self.config.SILO_POPUP_THRESHOLD)
-        confidences['silo'] = silo_conf
-        
-        close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
-        confidences['close'] = close_conf
-        
-        # PRIORITY-BASED LOCATION DETECTION
-        # Higher priority locations override lower ones, even if multiple detections pass threshold
+        def lookup(name: str, threshold: float) -> Tuple[Optional[int], Optional[int], float]:
+            if batch is not None and name in batch:
+                return batch[name]
+            return self.template_manager.find_template(screen, name, threshold=threshold)
+
+        # PRIORITY-BASED LOCATION DETECTION, evaluated lazily in priority
+        # order: each template is only matched once the higher-priority
+        # checks have failed, so the common cases pay for 1-2 scans instead
+        # of all 6. Higher priority locations override lower ones, even if
+        # multiple detections would pass their thresholds.
         locations = {}
-        
+
         # Priority 1: Silo popup (highest priority - always handle first)
+        silo_x, silo_y, silo_conf = lookup('silo', self.config.SILO_POPUP_THRESHOLD)
         if silo_x and silo_y and silo_conf >= self.config.SILO_POPUP_THRESHOLD:
             locations['silo_popup'] = silo_conf
             self.log(f"🏗️ PRIORITY: Silo popup detected (confidence: {silo_conf:.3f})")
             return locations
-        
+
         # Priority 2: Paper page (highest priority after silo)
+        paper_x, paper_y, paper_page_conf = lookup('paper_page', self.config.PAPER_PAGE_THRESHOLD)
         if paper_page_conf >= self.config.PAPER_PAGE_THRESHOLD:
             locations['paper_page'] = paper_page_conf
             self.log(f"📰 PRIORITY: Paper creation page detected (confidence: {paper_page_conf:.3f})")
             return locations
-        
+
         # Priority 3: Offer page (when confidence is high)
+        offer_x, offer_y, offer_conf = lookup('in_offer', self.config.OFFER_PAGE_THRESHOLD)
         if offer_conf >= getattr(self.config, 'OFFER_PAGE_PRIORITY_THRESHOLD', 0.8):
             locations['offer'] = offer_conf
             self.log(f"📝 PRIORITY: Offer page detected (confidence: {offer_conf:.3f})")
             return locations
-        
+
         # Priority 4: Market page (when confidence is high and offer is not detected)
+        market_x, market_y, market_conf = lookup('market', self.config.MARKET_PAGE_THRESHOLD)
         if market_conf >= getattr(self.config, 'MARKET_PAGE_PRIORITY_THRESHOLD', 0.7) and offer_conf < getattr(self.config, 'OFFER_PAGE_PRIORITY_THRESHOLD', 0.8):
             locations['market'] = market_conf
             self.log(f"🏪 PRIORITY: Market page detected (confidence: {market_conf:.3f})")
             return locations
-        
+
         # Priority 5: Main page (only when other specific pages are not clearly detected)
+        main_x, main_y, main_conf = lookup('main', self.config.MAIN_PAGE_THRESHOLD)
         if main_conf >= self.config.MAIN_PAGE_THRESHOLD and offer_conf < getattr(self.config, 'OFFER_PAGE_PRIORITY_THRESHOLD', 0.8) and market_conf < getattr(self.config, 'MARKET_PAGE_PRIORITY_THRESHOLD', 0.7) and paper_page_conf < self.config.PAPER_PAGE_THRESHOLD:
             locations['main'] = main_conf
             self.log(f"🏠 PRIORITY: Main page detected (confidence: {main_conf:.3f})")
             return locations
-        
+
         # Priority 6: Any dialog with close button
+        close_x, close_y, close_conf = lookup('close', self.config.CLOSE_BUTTON_THRESHOLD)
         if close_x and close_y and close_conf >= self.config.CLOSE_BUTTON_THRESHOLD:
             locations['dialog_open'] = close_conf
             self.log(f"🔲 PRIORITY: Dialog with close button detected (confidence: {close_conf:.3f})")
@@ -494,16 +556,22 @@ class MarketOperations:
     
     def is_on_main_page(self, screen: np.ndarray) -> Tuple[bool, float]:
         """Check if we're on the main farm page"""
+        if not self._page_probe_ok(screen, 'main'):
+            return False, 0.0
         main_x, main_y, confidence = self.template_manager.find_template(screen, 'main', threshold=self.config.MAIN_PAGE_THRESHOLD)
         return (main_x is not None and main_y is not None), confidence
-    
+
     def is_in_offer(self, screen: np.ndarray) -> Tuple[bool, float]:
         """Check if we're currently in the offer page"""
+        if not self._page_probe_ok(screen, 'in_offer'):
+            return False, 0.0
         offer_x, offer_y, confidence = self.template_manager.find_template(screen, 'in_offer', threshold=self.config.OFFER_PAGE_THRESHOLD)
         return (offer_x is not None and offer_y is not None), confidence
-    
+
     def is_in_paper_page(self, screen: np.ndarray) -> Tuple[bool, float]:
         """Check if we're currently in the paper creation page"""
+        if not self._page_probe_ok(screen, 'paper_page'):
+            return False, 0.0
         paper_x, paper_y, confidence = self.template_manager.find_template(screen, 'paper_page', threshold=self.config.PAPER_PAGE_THRESHOLD)
         return (paper_x is not None and paper_y is not None), confidence
     
@@ -519,7 +587,7 @@ class MarketOperations:
             return True
         
         # Check if paper_cooldown.png exists (means paper feature is in cooldown)
-        cooldown_x, cooldown_y, cooldown_conf = self.template_manager.find_template(screen, 'paper_cooldown', threshold=self.config.PAPER_COOLDOWN_THRESHOLD)
+        cooldown_x, cooldown_y, cooldown_conf = self.template_manager.find_template(screen, 'paper_cooldown', threshold=self.config.PAPER_COOLDOWN_THRESHOLD, roi=self.config.ROI_HINTS['paper_cooldown'])
         
         if cooldown_x and cooldown_y:
             self.log(f"⏳ Paper advertisement is in COOLDOWN (confidence: {cooldown_conf:.2f}, threshold: {self.config.PAPER_COOLDOWN_THRESHOLD}) - cannot create ads right now")
@@ -566,15 +634,20 @@ class MarketOperations:
         
         self.log(f"✅ Confirmed we're in paper page (confidence: {paper_page_conf:.2f})")
         
-        # Check for paper cooldown immediately after confirming we're in paper page
-        cooldown_x, cooldown_y, cooldown_conf = self.template_manager.find_template(screen, 'paper_cooldown', threshold=self.config.PAPER_COOLDOWN_THRESHOLD)
-        
-        if cooldown_x and cooldown_y:
+        # Cooldown banner and paper button are mutually exclusive states of
+        # the same dialog - resolve them with one prioritized scan
+        state_name, state_x, state_y, state_conf = self.template_manager.find_any(screen, [
+            ('paper_cooldown', self.config.PAPER_COOLDOWN_THRESHOLD, self.config.ROI_HINTS['paper_cooldown']),
+            ('paper_button', self.config.PAPER_BUTTON_THRESHOLD, self.config.ROI_HINTS['paper_button']),
+        ])
+
+        if state_name == 'paper_cooldown':
+            cooldown_conf = state_conf
             self.log(f"⏳ Paper advertisement is in COOLDOWN (confidence: {cooldown_conf:.2f}, threshold: {self.config.PAPER_COOLDOWN_THRESHOLD}) - cannot create ads right now")
             self.log("🕒 Skipping advertisement creation - paper feature is in cooldown, closing paper page...")
             
             # Close the paper page since we can't create ads
-            close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
+            close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD, roi=self.config.ROI_HINTS['close'])
             if close_x and close_y:
                 self.log(f"🔲 Closing paper page due to cooldown (confidence: {close_conf:.2f})")
                 self.safe_click(close_x, close_y, "close paper page - cooldown")
@@ -584,20 +657,27 @@ class MarketOperations:
             
             return True  # Return True to continue normal flow, just skip ad creation
         
-        paper_button_x, paper_button_y, paper_conf = self.template_manager.find_template(screen, 'paper_button', threshold=self.config.PAPER_BUTTON_THRESHOLD)
-        
-        if not paper_button_x or not paper_button_y:
-            self.log(f"❌ Paper button not found (confidence: {paper_conf:.2f})")
+        if state_name != 'paper_button':
+            self.log(f"❌ Paper button not found (best confidence: {state_conf:.2f})")
             return False
-        
-        self.log(f"📄 Clicking paper button (confidence: {paper_conf:.2f})")
-        self.safe_click(paper_button_x, paper_button_y, "paper button")
+
+        self.log(f"📄 Clicking paper button (confidence: {state_conf:.2f})")
+        self.safe_click(state_x, state_y, "paper button")
         time.sleep(self.config.MARKET_UI_WAIT)
         
-        # Step 3: Click paper_create.png to create the advertisement
-        screen = self.screen_capture.capture_screen(use_cache=False)
-        paper_create_x, paper_create_y, create_conf = self.template_manager.find_template(screen, 'paper_create', threshold=self.config.PAPER_CREATE_THRESHOLD)
-        
+        # Step 3: Click paper_create.png to create the advertisement.
+        # After MARKET_UI_WAIT the button is usually already up - try the
+        # cached frame first and only pay a fresh grab on a miss
+        paper_create_x = paper_create_y = None
+        create_conf = 0.0
+        for _ in range(3):
+            screen = self.screen_capture.capture_screen(use_cache=True)
+            paper_create_x, paper_create_y, create_conf = self.template_manager.find_template(screen, 'paper_create', threshold=self.config.PAPER_CREATE_THRESHOLD, roi=self.config.ROI_HINTS['paper_create'])
+            if paper_create_x:
+                break
+            self.screen_capture.invalidate_cache()
+            time.sleep(0.15)
+
         if not paper_create_x or not paper_create_y:
             self.log(f"❌ Paper create button not found (confidence: {create_conf:.2f})")
             return False
@@ -3,6 +3,7 @@ Optimized bot operations for HayDay Bot
 Fast and efficient farming operations with minimal delays
 """
 
+import sys
 import time
 import threading
 import pyautogui as pag
@@ -13,6 +14,45 @@ from core import DetectionState, BotState, ScreenCapture, TemplateManager, PathG
 from config import BotConfig
 
 
+if sys.platform == 'win32':
+    # Raw SendInput click path: one syscall for move+down+up, skipping
+    # PyAutoGUI's per-call pause, failsafe check and position re-reads
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG),
+                    ('mouseData', wintypes.DWORD), ('dwFlags', wintypes.DWORD),
+                    ('time', wintypes.DWORD),
+                    ('dwExtraInfo', ctypes.POINTER(wintypes.ULONG))]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [('type', wintypes.DWORD), ('mi', _MOUSEINPUT)]
+
+    _MOUSEEVENTF_MOVE = 0x0001
+    _MOUSEEVENTF_LEFTDOWN = 0x0002
+    _MOUSEEVENTF_LEFTUP = 0x0004
+    _MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    def _send_raw_click(x: int, y: int) -> bool:
+        """Move the cursor and left-click in a single SendInput batch"""
+        w = _user32.GetSystemMetrics(0)
+        h = _user32.GetSystemMetrics(1)
+        ax = int(x * 65535 / max(1, w - 1))
+        ay = int(y * 65535 / max(1, h - 1))
+        inputs = (_INPUT * 3)()
+        inputs[0].mi.dx = ax
+        inputs[0].mi.dy = ay
+        inputs[0].mi.dwFlags = _MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE
+        inputs[1].mi.dwFlags = _MOUSEEVENTF_LEFTDOWN
+        inputs[2].mi.dwFlags = _MOUSEEVENTF_LEFTUP
+        return _user32.SendInput(3, inputs, ctypes.sizeof(_INPUT)) == 3
+else:
+    _send_raw_click = None
+
+
 class BotOperations:
     """Fast bot operations with optimized performance"""
     
@@ -30,16 +70,13 @@ class BotOperations:
         self.log = log_callback
     
     def interruptible_sleep(self, total_time: float) -> bool:
-        """Fast interruptible sleep with stop signal checking"""
-        elapsed = 0
-        chunk_size = min(self.config.STOP_CHECK_INTERVAL, 1.0)  # Max 1 second chunks
-        
-        while elapsed < total_time and not self.stop_event.is_set():
-            sleep_time = min(chunk_size, total_time - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
-            
-        return self.stop_event.is_set()
+        """Fast interruptible sleep with stop signal checking
+
+        A single Event.wait instead of a poll loop: the OS wakes us the
+        moment stop_event is set, so stop latency is effectively zero and
+        a long sleep costs one syscall rather than one per check interval.
+        """
+        return self.stop_event.wait(timeout=total_time)
     
     def safe_click(self, x: int, y: int, description: str = "") -> bool:
         """Fast click with minimal delay"""
@@ -48,8 +85,42 @@ class BotOperations:
             
         self.log(f"🖱️ {description} at ({x}, {y})")
         pag.click(x, y, duration=self.config.DEFAULT_MOVEMENT_SPEED)
+        # The click may have changed the UI - cached frames are now stale
+        self.screen_capture.invalidate_cache()
         return not self.interruptible_sleep(self.config.DEFAULT_CLICK_DELAY)
-        
+
+    def safe_click_burst(self, x: int, y: int, n: int, interval: float = 0.05,
+                         description: str = "") -> bool:
+        """Fire several clicks at one spot before the caller re-checks state
+
+        Avoids the full click -> sleep -> capture -> detect round trip for
+        each click when the UI simply consumes queued clicks (e.g. ramping
+        a quantity stepper). The cursor is moved once; the clicks land
+        without movement delay.
+        """
+        if not self.bot_state.running or self.stop_event.is_set():
+            return False
+
+        self.log(f"🖱️ {description} x{n} at ({x}, {y})")
+        if _send_raw_click is not None:
+            # Raw platform clicks: no animated move wanted here, so skip
+            # PyAutoGUI's per-click overhead entirely
+            for _ in range(n):
+                if self.stop_event.is_set():
+                    return False
+                _send_raw_click(x, y)
+                time.sleep(interval)
+        else:
+            pag.moveTo(x, y, duration=self.config.DEFAULT_MOVEMENT_SPEED)
+            for _ in range(n):
+                if self.stop_event.is_set():
+                    return False
+                pag.click()
+                time.sleep(interval)
+        self.screen_capture.invalidate_cache()
+        return not self.interruptible_sleep(self.config.DEFAULT_CLICK_DELAY)
+
+
     def safe_move(self, x: int, y: int, duration: Optional[float] = None) -> bool:
         """Fast mouse movement"""
         if not self.bot_state.running or self.stop_event.is_set():
@@ -61,6 +132,47 @@ class BotOperations:
         pag.moveTo(x, y, duration=duration)
         return True
     
+    def _follow_path(self, path: np.ndarray, move_duration: float,
+                     progress_label: str) -> None:
+        """Drag the held mouse along a path with relative moves
+
+        Deltas are precomputed from the path array, so each step is one
+        moveRel without a cursor-position round trip, and PyAutoGUI's
+        global per-call pause is suspended for the duration of the drag.
+        Assumes the button is already down; the caller releases it.
+        """
+        # Anchor absolutely on the first point, then go relative
+        pag.moveTo(int(path[0, 0]), int(path[0, 1]),
+                   duration=move_duration, _pause=False)
+        dx = np.diff(path[:, 0]).tolist()
+        dy = np.diff(path[:, 1]).tolist()
+        total = len(dx)
+
+        # Bind the loop invariants to locals and amortize the stop check
+        # over 16 points - the attribute lookups and event polls are
+        # measurable against a ~100us move
+        stop_is_set = self.stop_event.is_set
+        bot_state = self.bot_state
+        move_rel = pag.moveRel
+        log_progress = self.config.ENABLE_PROGRESS_LOGGING
+        log_interval = self.config.PROGRESS_LOG_INTERVAL
+
+        prev_pause = pag.PAUSE
+        pag.PAUSE = 0
+        try:
+            for i in range(total):
+                if (i & 15) == 0:
+                    if stop_is_set() or not bot_state.running:
+                        break
+                    # Progress logging every log_interval-th check
+                    if log_progress and (i >> 4) % log_interval == 0:
+                        progress_pct = int((i + 1) / total * 100)
+                        self.log(f"{progress_label} {progress_pct}%")
+
+                move_rel(dx[i], dy[i], duration=move_duration, _pause=False)
+        finally:
+            pag.PAUSE = prev_pause
+
     def plant_wheat(self, cx: int, cy: int, contour: Optional[np.ndarray]) -> bool:
         """Optimized wheat planting with proper recentering and path updates"""
         if not self.bot_state.running:
@@ -127,40 +239,33 @@ class BotOperations:
                 # Update contour coordinates to match the new centered position
                 # Calculate the offset between old and new center positions
                 screen = self.screen_capture.capture_screen(use_cache=False)
+                bbox = mask = None
                 if screen is not None:
                     # Get the current field detection with updated coordinates
                     with self.detection_lock:
                         updated_contour = self.detection_state.contour if self.detection_state.contour is not None else contour
-                    
+                        bbox = self.detection_state.contour_bbox
+                        mask = self.detection_state.contour_mask
+
                     if updated_contour is not None:
                         self.log("🎯 Using updated contour after screen centering")
                         contour = updated_contour
                     else:
                         self.log("⚠️ Using original contour as fallback")
-                
-                # Create planting path with UPDATED coordinates after screen centering
-                planting_path = PathGenerator.create_linear_path(cx, cy, contour, "plant")
+                        bbox = mask = None
+
+                # Create planting path with UPDATED coordinates after screen centering,
+                # reusing the geometry the detector already derived
+                planting_path = PathGenerator.create_linear_path(cx, cy, contour, "plant",
+                                                                 bbox=bbox, mask=mask)
                 
                 # Lock the path - no updates during execution!
                 self.bot_state.path_execution_active = True
                 self.log(f"🌱 Following locked planting path with {len(planting_path)} points (no dynamic updates)...")
-                
-                for i, (x, y) in enumerate(planting_path):
-                    if not self.bot_state.running or self.stop_event.is_set():
-                        break
-                    
-                    # Progress logging with configurable interval
-                    if self.config.ENABLE_PROGRESS_LOGGING:
-                        if i % self.config.PROGRESS_LOG_INTERVAL == 0:
-                            progress_pct = int((i+1) / len(planting_path) * 100)
-                            self.log(f"🌾 Planting progress {progress_pct}%")
-                    
-                    # Move at maximum speed using config setting
-                    move_duration = min(0.02, self.config.DEFAULT_MOVEMENT_SPEED)  # Ultra fast movement
-                    if not self.safe_move(int(x), int(y), duration=move_duration):
-                        break
-                        
-                    # No sleep between points for maximum speed
+
+                move_duration = min(0.02, self.config.DEFAULT_MOVEMENT_SPEED)  # Ultra fast movement
+                self._follow_path(planting_path, move_duration,
+                                  "🌾 Planting progress")
             
             # Return to center before releasing
             self.log("🎯 Returning to center before release")
@@ -219,42 +324,35 @@ class BotOperations:
             if contour is not None:
                 # Update contour coordinates to match the current field position
                 screen = self.screen_capture.capture_screen(use_cache=False)
+                bbox = mask = None
                 if screen is not None:
                     # Get the current field detection with updated coordinates
                     with self.detection_lock:
                         updated_contour = self.detection_state.contour if self.detection_state.contour is not None else contour
                         updated_cx, updated_cy = self.detection_state.center if self.detection_state.center else (cx, cy)
-                    
+                        bbox = self.detection_state.contour_bbox
+                        mask = self.detection_state.contour_mask
+
                     if updated_contour is not None:
                         self.log("🎯 Using updated contour for harvesting")
                         contour = updated_contour
                         cx, cy = updated_cx, updated_cy  # Use updated center too
                     else:
                         self.log("⚠️ Using original contour for harvesting as fallback")
-                
-                # Create harvest path with UPDATED coordinates
-                harvest_path = PathGenerator.create_linear_path(cx, cy, contour, "harvest")
+                        bbox = mask = None
+
+                # Create harvest path with UPDATED coordinates, reusing the
+                # geometry the detector already derived
+                harvest_path = PathGenerator.create_linear_path(cx, cy, contour, "harvest",
+                                                                bbox=bbox, mask=mask)
                 
                 # Lock the path - no updates during execution!
                 self.bot_state.path_execution_active = True
                 self.log(f"🚜 Following locked harvest path with {len(harvest_path)} points (no dynamic updates)...")
-                
-                for i, (x, y) in enumerate(harvest_path):
-                    if not self.bot_state.running or self.stop_event.is_set():
-                        break
-                    
-                    # Progress logging with configurable interval
-                    if self.config.ENABLE_PROGRESS_LOGGING:
-                        if i % self.config.PROGRESS_LOG_INTERVAL == 0:
-                            progress_pct = int((i+1) / len(harvest_path) * 100)
-                            self.log(f"🚜 Harvest progress {progress_pct}%")
-                    
-                    # Move at maximum speed for harvesting
-                    move_duration = min(0.02, self.config.DEFAULT_MOVEMENT_SPEED)  # Ultra fast movement
-                    if not self.safe_move(int(x), int(y), duration=move_duration):
-                        break
-                        
-                    # No sleep between points for maximum speed
+
+                move_duration = min(0.02, self.config.DEFAULT_MOVEMENT_SPEED)  # Ultra fast movement
+                self._follow_path(harvest_path, move_duration,
+                                  "🚜 Harvest progress")
             
             # Return to center before releasing
             self.log("🎯 Returning to center before release")
@@ -63,6 +63,7 @@ class BotConfig:
     
     # ==================== PERFORMANCE SETTINGS ====================
     DETECTION_UPDATE_INTERVAL = 0.3  # Faster updates
+    VISUAL_UPDATE_INTERVAL = 0.066   # Overlay publish rate cap (~15fps)
     STOP_CHECK_INTERVAL = 0.1
     MAX_SLEEP_CHUNK = 1.0            # Maximum sleep chunk size
     THREAD_SHUTDOWN_TIMEOUT = 3.0    # Faster shutdown
@@ -89,6 +90,37 @@ class BotConfig:
     MARKET_BUTTON_WAIT = 0.2
     ENABLE_GROWTH_MARKET_MANAGEMENT = True
     
+    # Scale of the coarse pass used by template detection. Matching runs
+    # first at this fraction of full resolution (pyramid downsampling) and
+    # only refines near hits, so lowering it cuts NCC pixel traffic
+    # quadratically. Must be a power-of-two fraction (0.5, 0.25, ...).
+    SCREEN_DETECTION_SCALE = 0.25
+
+    # Optional O(1) page probes checked before running template matching.
+    # Maps a page template name to ((x, y), (b, g, r), tolerance): if the
+    # pixel at (x, y) differs from the reference color by more than the
+    # tolerance (summed over channels), the page check reports a miss
+    # without any NCC work. Coordinates are setup-specific, so this ships
+    # empty - populate it for your resolution/window placement.
+    PAGE_PROBE_PIXELS = {}
+
+    # ==================== ROI SEARCH HINTS ====================
+    # Fractional (y0, y1, x0, x1) screen regions where a UI element can
+    # appear. Restricting template searches to these boxes skips the large
+    # majority of screen pixels that can never contain the element.
+    ROI_HINTS = {
+        'close': (0.0, 0.65, 0.45, 1.0),           # Dialog close buttons (top-right)
+        'market_button': (0.45, 1.0, 0.45, 1.0),   # Market entry (bottom-right)
+        'plus_button': (0.15, 0.95, 0.3, 1.0),     # Quantity dialog controls
+        'arrow_button': (0.15, 0.95, 0.3, 1.0),    # Price dialog controls
+        'paper_cooldown': (0.15, 0.85, 0.15, 0.85),  # Cooldown banner (dialog center)
+        'paper_button': (0.2, 0.95, 0.15, 0.85),     # Paper dialog controls
+        'paper_create': (0.2, 0.95, 0.15, 0.85),     # Paper dialog controls
+        'collect': (0.4, 1.0, 0.4, 1.0),             # Collect button (bottom-right)
+        'new_offer': (0.15, 0.9, 0.1, 0.9),          # Empty slots in market grid
+        'silo': (0.1, 0.9, 0.1, 0.9),                # Silo-full popup (centered)
+    }
+
     # ==================== RESOLUTION & TEMPLATES ====================
     TEMPLATE_1K_DIR = "templates/1ktemplates"
     TEMPLATE_2K_DIR = "templates/2ktemplates"
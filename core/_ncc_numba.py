@@ -0,0 +1,77 @@
+"""
+Optional Numba-accelerated NCC kernels for HayDay Bot
+
+These kernels cover the equal-size fast path of template matching, where
+the pyramid search has already narrowed the candidate down to a single
+crop the same size as the template. Numba is an optional dependency -
+when it is not installed, TemplateManager silently falls back to
+cv2.matchTemplate.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ncc_same_size_impl(img, tmpl, sum_t, sum_t2):
+        """Zero-normalized cross-correlation of two equal-size buffers
+
+        Equivalent to cv2.TM_CCOEFF_NORMED for the full-overlap case. The
+        template-side sums are precomputed by the caller - templates are
+        immutable, so only the image-side accumulation runs per call.
+        """
+        h, w, c = img.shape
+        n = h * w * c
+        sum_i = 0.0
+        sum_it = 0.0
+        sum_i2 = 0.0
+
+        for yy in prange(h):
+            for xx in range(w):
+                for ch in range(c):
+                    iv = float(img[yy, xx, ch])
+                    tv = float(tmpl[yy, xx, ch])
+                    sum_i += iv
+                    sum_it += iv * tv
+                    sum_i2 += iv * iv
+
+        denom = np.sqrt((sum_i2 - sum_i * sum_i / n) * (sum_t2 - sum_t * sum_t / n))
+        if denom <= 0.0:
+            return 0.0
+        return (sum_it - sum_i * sum_t / n) / denom
+
+    def _as_3d(img: np.ndarray) -> np.ndarray:
+        """Present grayscale buffers as single-channel 3D for the kernel"""
+        contiguous = np.ascontiguousarray(img)
+        if contiguous.ndim == 2:
+            return contiguous.reshape(contiguous.shape[0], contiguous.shape[1], 1)
+        return contiguous
+
+    def template_stats(tmpl: np.ndarray) -> tuple:
+        """Precompute the (sum, squared-sum) pair for an immutable template"""
+        t = tmpl.astype(np.float64)
+        return (float(t.sum()), float((t * t).sum()))
+
+    def ncc_same_size(img: np.ndarray, tmpl: np.ndarray,
+                      tmpl_stats: tuple = None) -> float:
+        """NCC score of two equal-size buffers"""
+        if tmpl_stats is None:
+            tmpl_stats = template_stats(tmpl)
+        return float(_ncc_same_size_impl(_as_3d(img), _as_3d(tmpl),
+                                         tmpl_stats[0], tmpl_stats[1]))
+
+    def ncc_crop(screen: np.ndarray, tmpl: np.ndarray, y: int, x: int,
+                 tmpl_stats: tuple = None) -> float:
+        """NCC score of the template against the screen crop at (y, x)"""
+        h, w = tmpl.shape[:2]
+        return ncc_same_size(screen[y:y + h, x:x + w], tmpl, tmpl_stats)
+else:
+    template_stats = None
+    ncc_same_size = None
+    ncc_crop = None
@@ -7,64 +7,152 @@ and harvesting operations using linear patterns with straight lines.
 
 import cv2
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Optional, Tuple
+
+from core._path_numba import NUMBA_AVAILABLE, linear_path
 
 
 class PathGenerator:
     """Generates efficient paths for planting and harvesting"""
-    
+
+    # (line_spacing, line_step, x_spacing, vert_step) per path type -
+    # resolved with one lookup instead of four per-call conditionals
+    SPACING = {
+        'plant': (45, 40, 90, 50),
+        'harvest': (55, 50, 165, 60),
+    }
+
     @staticmethod
-    def create_linear_path(cx: int, cy: int, contour: Optional[np.ndarray], path_type: str = "plant") -> List[Tuple[int, int]]:
-        """Create an efficient linear path with straight lines"""
+    def create_linear_path(cx: int, cy: int, contour: Optional[np.ndarray], path_type: str = "plant",
+                           bbox: Optional[Tuple[int, int, int, int]] = None,
+                           mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Create an efficient linear path with straight lines
+
+        Returns an (N, 2) int32 array of points - one contiguous buffer
+        instead of a list of boxed tuples, so the drag loops iterate plain
+        ints without per-point conversions.
+
+        `bbox` and `mask` accept the geometry precomputed by the detector
+        (see contour_geometry); when provided, the bounds scan and
+        rasterization are skipped entirely.
+        """
         if contour is None:
-            return [(cx, cy)]
-        
-        # Get contour bounds
-        contour_points = contour.reshape(-1, 2)
-        min_x, min_y = np.min(contour_points, axis=0)
-        max_x, max_y = np.max(contour_points, axis=0)
-        
-        path = [(cx, cy)]  # Start from center
-        
+            return np.array([[cx, cy]], dtype=np.int32)
+
         # Configure spacing based on path type
-        line_spacing = 45 if path_type == "plant" else 55
-        line_step = 40 if path_type == "plant" else 50
-        
+        spacing = PathGenerator.SPACING.get(path_type, PathGenerator.SPACING['plant'])
+        line_spacing, line_step, x_spacing, vert_step = spacing
+
+        if bbox is None or mask is None:
+            # JIT kernel runs the whole scan in nopython mode - the Python
+            # loops below pay one interpreter round trip per tested point,
+            # which dominates the cost of this function
+            if NUMBA_AVAILABLE:
+                return PathGenerator._decimate(
+                    linear_path(contour, cx, cy, line_spacing, line_step,
+                                x_spacing, vert_step))
+            bbox, mask = PathGenerator.contour_geometry(contour)
+
+        min_x, min_y, max_x, max_y = bbox
+
+        bb_h, bb_w = mask.shape
+
+        # Batched row/column extents: one vectorized pass over the mask
+        # replaces the per-scanline Python sweep for leftmost/rightmost
+        row_has = mask.any(axis=1)
+        row_left = mask.argmax(axis=1)
+        row_right = bb_w - 1 - mask[:, ::-1].argmax(axis=1)
+        col_has = mask.any(axis=0)
+        col_top = mask.argmax(axis=0)
+        col_bottom = bb_h - 1 - mask[::-1].argmax(axis=0)
+
         # Create horizontal lines from top to bottom
-        start_y = int(min_y + line_spacing // 2)
-        end_y = int(max_y - line_spacing // 2)
+        start_y = min_y + line_spacing // 2
+        end_y = max_y - line_spacing // 2
         y_positions = list(range(start_y, end_y + 1, line_spacing))
-        
-        for y in y_positions:
-            # Find the leftmost and rightmost points at this y level within contour
-            line_points = []
-            for x in range(int(min_x), int(max_x) + 1, 10):
-                if cv2.pointPolygonTest(contour, (float(x), float(y)), False) >= 0:
-                    line_points.append(x)
-            
-            if line_points:
-                left_x, right_x = min(line_points), max(line_points)
-                # Add points along the horizontal line
-                for x in range(left_x, right_x + 1, line_step):
-                    if cv2.pointPolygonTest(contour, (float(x), float(y)), False) >= 0:
-                        path.append((x, y))
-        
+
         # Add vertical coverage lines for missed areas
-        x_spacing = line_spacing * 2 if path_type == "plant" else line_spacing * 3
-        x_positions = list(range(int(min_x + line_spacing // 2), int(max_x), x_spacing))
-        
+        x_positions = list(range(min_x + line_spacing // 2, max_x, x_spacing))
+
+        # Preallocate the output from an upper bound on emitted points so
+        # the loops write straight into one int32 buffer - no list growth,
+        # no per-point tuple boxing
+        cap = (2 + len(y_positions) * (bb_w // line_step + 2)
+               + len(x_positions) * (bb_h // vert_step + 2))
+        path = np.empty((cap, 2), dtype=np.int32)
+        path[0] = (cx, cy)  # Start from center
+        k = 1
+
+        for y in y_positions:
+            yi = y - min_y
+            if not row_has[yi]:
+                continue
+            # Add points along the horizontal line, keeping only those inside
+            xs = np.arange(min_x + row_left[yi], min_x + row_right[yi] + 1, line_step)
+            xs = xs[mask[yi, xs - min_x] > 0]
+            path[k:k + len(xs), 0] = xs
+            path[k:k + len(xs), 1] = y
+            k += len(xs)
+
         for x in x_positions:
-            line_points = []
-            for y in range(int(min_y), int(max_y) + 1, 10):
-                if cv2.pointPolygonTest(contour, (float(x), float(y)), False) >= 0:
-                    line_points.append(y)
-            
-            if line_points:
-                top_y, bottom_y = min(line_points), max(line_points)
-                step_size = 50 if path_type == "plant" else 60
-                for y in range(top_y, bottom_y + 1, step_size):
-                    if cv2.pointPolygonTest(contour, (float(x), float(y)), False) >= 0:
-                        path.append((x, y))
-        
-        path.append((cx, cy))  # End at center
-        return path 
\ No newline at end of file
+            xi = x - min_x
+            if not col_has[xi]:
+                continue
+            ys = np.arange(min_y + col_top[xi], min_y + col_bottom[xi] + 1, vert_step)
+            ys = ys[mask[ys - min_y, xi] > 0]
+            path[k:k + len(ys), 0] = x
+            path[k:k + len(ys), 1] = ys
+            k += len(ys)
+
+        path[k] = (cx, cy)  # End at center
+        return PathGenerator._decimate(path[:k + 1])
+
+    @staticmethod
+    def _decimate(path: np.ndarray, min_step: int = 5) -> np.ndarray:
+        """Drop path points within min_step (L-inf) of the last kept one
+
+        The scanline pattern emits near-duplicate points where horizontal
+        and vertical lines meet; each one costs a full moveTo in the drag
+        loop for no extra soil coverage. First and last points always
+        survive so the drag still starts and ends at the field center.
+        """
+        if len(path) <= 2:
+            return path
+        keep = np.ones(len(path), dtype=bool)
+        last_x, last_y = int(path[0, 0]), int(path[0, 1])
+        pts = path.tolist()
+        for i in range(1, len(pts) - 1):
+            x, y = pts[i]
+            if abs(x - last_x) < min_step and abs(y - last_y) < min_step:
+                keep[i] = False
+            else:
+                last_x, last_y = x, y
+        return path[keep]
+
+    @staticmethod
+    def contour_geometry(contour: np.ndarray) -> Tuple[Tuple[int, int, int, int], np.ndarray]:
+        """Precompute the bounding box and filled mask for a contour
+
+        The detector calls this once per contour update and stores the
+        result in DetectionState, so planting and harvesting never pay the
+        bounds scan or rasterization again.
+        """
+        contour_points = contour.reshape(-1, 2)
+        min_x, min_y = np.min(contour_points, axis=0)
+        max_x, max_y = np.max(contour_points, axis=0)
+        bbox = (int(min_x), int(min_y), int(max_x), int(max_y))
+
+        # Rasterize the contour once: every inside-test becomes a single
+        # array load instead of a full polygon scan per point
+        return bbox, PathGenerator._rasterize_contour(contour, *bbox)
+
+    @staticmethod
+    def _rasterize_contour(contour: np.ndarray, min_x: int, min_y: int,
+                           max_x: int, max_y: int) -> np.ndarray:
+        """Fill the contour into a uint8 mask covering its bounding box"""
+        bb_w = max_x - min_x + 1
+        bb_h = max_y - min_y + 1
+        mask = np.zeros((bb_h, bb_w), dtype=np.uint8)
+        shifted = contour.reshape(-1, 1, 2) - np.array([min_x, min_y], dtype=contour.dtype)
+        cv2.drawContours(mask, [shifted], -1, 1, thickness=cv2.FILLED)
+        return mask
\ No newline at end of file
@@ -4,46 +4,147 @@ Fast screen capture with intelligent caching for better performance
 """
 
 import time
+import threading
 import numpy as np
 import mss
-import cv2
 from typing import Optional
 
 
 class ScreenCapture:
     """Fast screen capture with optimized caching"""
-    
+
     def __init__(self):
         self._last_capture_time = 0
         self._cached_screen: Optional[np.ndarray] = None
         self._cache_duration = 0.05  # 50ms cache for better performance
-        
-    def capture_screen(self, use_cache: bool = True) -> np.ndarray:
-        """Fast screen capture with caching - thread-safe"""
+        # Even "fresh" captures tolerate this much staleness - back-to-back
+        # uncached calls in one workflow tick then share a single grab
+        self._fresh_duration = 0.02
+        # Two reusable BGR frame buffers, swapped per grab - repeated
+        # captures allocate nothing, and a frame handed to one thread
+        # stays intact while another thread grabs the next one
+        self._frame_bufs: list = [None, None]
+        self._buf_idx = 0
+        self._capture_lock = threading.Lock()
+        # mss handles are not thread-safe but are cheap to keep per thread;
+        # creating one per grab costs an X11/DXGI handshake every capture
+        self._local = threading.local()
+        # Optional background producer keeping the cache warm so consumer
+        # threads take the latest frame instead of blocking on a grab
+        self._async_thread: Optional[threading.Thread] = None
+        self._async_stop: Optional[threading.Event] = None
+        self._async_interval = 0.1
+
+    def capture_screen(self, use_cache: bool = True,
+                       max_age: Optional[float] = None) -> np.ndarray:
+        """Fast screen capture with caching - thread-safe
+
+        `max_age` is the staleness the caller tolerates in seconds; it
+        defaults to the cache duration (50ms) for cached calls and a small
+        fresh-grab window (20ms) for uncached ones, so several uncached
+        checks issued in the same tick still share one grab.
+
+        The returned array aliases one of two internal frame buffers and
+        stays valid until the capture after next (the buffers alternate);
+        callers that need to retain a frame longer must take an explicit
+        .copy().
+        """
         current_time = time.time()
-        
-        # Return cached screen if valid
-        if (use_cache and self._cached_screen is not None and 
-            (current_time - self._last_capture_time) < self._cache_duration):
+
+        if max_age is None:
+            if self._async_thread is not None and self._async_thread.is_alive():
+                # Producer keeps the cache warm at its own cadence - hand
+                # back the latest frame in O(1) instead of blocking
+                max_age = self._async_interval * 1.5
+            else:
+                max_age = self._cache_duration if use_cache else self._fresh_duration
+
+        # Return cached screen if still fresh enough for this caller
+        if (self._cached_screen is not None and
+            (current_time - self._last_capture_time) < max_age):
             return self._cached_screen
-        
-        # Create new MSS instance for each capture to avoid threading issues
-        with mss.mss() as sct:
+
+        with self._capture_lock:
+            sct = self._get_sct()
             monitor = sct.monitors[1]  # Primary monitor
             screenshot = sct.grab(monitor)
-            
-            # Convert to OpenCV format (faster method)
-            img = np.frombuffer(screenshot.rgb, dtype=np.uint8)
-            img = img.reshape(screenshot.height, screenshot.width, 3)
-            screen = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
-        
-        # Update cache
-        if use_cache:
-            self._cached_screen = screen
-            self._last_capture_time = current_time
-        
+
+            # View the raw BGRA grab in place - no RGB repack, no cvtColor.
+            # Dropping the alpha plane into the persistent buffer is the
+            # only copy the frame pays.
+            raw = np.frombuffer(screenshot.raw, dtype=np.uint8)
+            raw = raw.reshape(screenshot.height, screenshot.width, 4)
+
+            idx = self._buf_idx ^ 1
+            buf = self._frame_bufs[idx]
+            if buf is None or buf.shape[:2] != raw.shape[:2]:
+                buf = np.empty((raw.shape[0], raw.shape[1], 3), dtype=np.uint8)
+                self._frame_bufs[idx] = buf
+            np.copyto(buf, raw[:, :, :3])
+            self._buf_idx = idx
+            screen = buf
+
+        # Every grab refreshes the cache - the frame lives in the shared
+        # buffer either way, so recording it costs nothing
+        self._cached_screen = screen
+        self._last_capture_time = current_time
+
         return screen
     
+    def _get_sct(self):
+        """Get (or lazily create) this thread's persistent mss handle"""
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+        return sct
+
+    def start_async(self, fps_hint: int = 10) -> None:
+        """Start a daemon producer that pre-captures at roughly fps_hint
+
+        While it runs, capture_screen callers that don't pass an explicit
+        max_age get the latest produced frame without ever blocking on a
+        grab themselves. Explicit max_age values still force fresher
+        frames when a caller needs one.
+        """
+        if self._async_thread is not None and self._async_thread.is_alive():
+            return
+
+        self._async_interval = 1.0 / max(fps_hint, 1)
+        self._async_stop = threading.Event()
+        stop = self._async_stop
+
+        def _producer():
+            while not stop.wait(self._async_interval):
+                try:
+                    self.capture_screen(use_cache=False,
+                                        max_age=self._async_interval / 2)
+                except Exception:
+                    # A transient grab failure shouldn't kill the producer;
+                    # consumers fall back to grabbing on demand
+                    pass
+
+        self._async_thread = threading.Thread(target=_producer, daemon=True,
+                                              name='screen-capture-producer')
+        self._async_thread.start()
+
+    def stop_async(self) -> None:
+        """Stop the background capture producer"""
+        if self._async_stop is not None:
+            self._async_stop.set()
+        if self._async_thread is not None:
+            self._async_thread.join(timeout=1.0)
+            self._async_thread = None
+
+    @staticmethod
+    def frame_hash(screen: np.ndarray) -> int:
+        """Cheap content hash of a strided subsample of a frame
+
+        Used by polling loops to skip template matching entirely when the
+        screen has not changed since the previous poll.
+        """
+        return hash(screen[::32, ::32].tobytes())
+
     def invalidate_cache(self) -> None:
         """Clear the screen cache"""
         self._cached_screen = None
@@ -51,6 +152,11 @@ class ScreenCapture:
         
     def cleanup(self):
         """Cleanup resources safely"""
-        # No persistent MSS instance to cleanup
+        self.stop_async()
+        sct = getattr(self._local, 'sct', None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
         self._cached_screen = None
-        self._last_capture_time = 0 
\ No newline at end of file
+        self._frame_bufs = [None, None]
+        self._last_capture_time = 0
\ No newline at end of file
@@ -3,8 +3,13 @@ import numpy as np
 import os
 from typing import Optional, List, Dict, Tuple, Union
 from config import BotConfig
+from core._coverage_numba import NUMBA_AVAILABLE, coverage_counts
 
 class SoilDetector:
+    # Templates at least this large take the FFT correlation path; below
+    # it OpenCV's spatial matchTemplate wins on constant factors
+    FFT_TEMPLATE_AREA = 100 * 100
+
     def __init__(self) -> None:
         """Initialize soil detector with template-based detection"""
         self.config = BotConfig()
@@ -12,7 +17,49 @@ class SoilDetector:
         # Initialize template variables (will be loaded later)
         self.field_template: Optional[np.ndarray] = None
         self.wheat_template: Optional[np.ndarray] = None
+        # Grayscale copies, converted once at load time - templates never
+        # change, so per-call cvtColor in the match loop is pure waste
+        self.field_template_gray: Optional[np.ndarray] = None
+        self.wheat_template_gray: Optional[np.ndarray] = None
         self.templates_loaded: bool = False
+
+        # Per-frame grayscale cache - detect_field probes several templates
+        # against the same frame and BGR2GRAY is a full-frame pass
+        self._screen_gray: Optional[np.ndarray] = None
+        self._screen_gray_key: Optional[tuple] = None
+
+        # Matching per-frame HSV cache - detect_field converts once and
+        # hands the result to the wheat segmentation on the same frame
+        self._screen_hsv: Optional[np.ndarray] = None
+        self._screen_hsv_key: Optional[tuple] = None
+
+        # Shared morphology kernel - built once instead of per frame
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+
+        # Optimized HSV range for bright yellow/golden wheat (based on
+        # actual sampling): broad yellow through golden
+        self._wheat_lower = np.array([15, 100, 150])
+        self._wheat_upper = np.array([35, 255, 255])
+
+        # Brown tones of bare soil, used as a fallback when no field
+        # template is available to match
+        self._soil_lower = np.array([10, 40, 40])
+        self._soil_upper = np.array([25, 180, 180])
+
+        # Route the HSV pipeline through OpenCV's T-API when an OpenCL
+        # device is available - cvtColor/inRange/morphology all offload
+        try:
+            self._use_opencl = bool(cv2.ocl.haveOpenCL())
+        except AttributeError:
+            self._use_opencl = False
+
+        # Reusable mask buffers keyed by (role, shape) - a screen-sized
+        # zeroed allocation per frame is page-fault heavy at 1440p
+        self._mask_bufs: Dict[tuple, np.ndarray] = {}
+
+        # 1/8-scale grayscale field template for the cheap farm probe,
+        # built lazily on the first gated detect_field call
+        self._probe_template: Optional[np.ndarray] = None
     
     def load_templates(self, template_dir: str) -> None:
         """Load templates from the specified directory"""
@@ -25,49 +72,161 @@ class SoilDetector:
             self.field_template = cv2.imread(field_template_path)
         else:
             self.field_template = None
-        
+
         # Load wheat template (grown wheat)
         wheat_template_path = os.path.join(template_dir, 'wheat.png')
         if os.path.exists(wheat_template_path):
             self.wheat_template = cv2.imread(wheat_template_path)
         else:
             self.wheat_template = None
-            
+
+        if self.field_template is not None:
+            self.field_template_gray = cv2.cvtColor(self.field_template, cv2.COLOR_BGR2GRAY)
+        if self.wheat_template is not None:
+            self.wheat_template_gray = cv2.cvtColor(self.wheat_template, cv2.COLOR_BGR2GRAY)
+
         self.templates_loaded = True
     
-    def find_template_matches(self, screen: np.ndarray, template: Optional[np.ndarray], threshold: float = 0.6) -> List[Dict[str, Union[int, float]]]:
-        """Find all matches of a template in the screen"""
+    def find_template_matches(self, screen: np.ndarray, template: Optional[np.ndarray],
+                              threshold: float = 0.9, downscale: float = 1.0,
+                              template_gray: Optional[np.ndarray] = None) -> List[Dict[str, Union[int, float]]]:
+        """Find all matches of a template in the screen
+
+        Uses TM_CCORR_NORMED - it skips the per-window mean subtraction
+        TM_CCOEFF_NORMED pays, which is plenty for the coarse "find soil
+        patches" task (note the recalibrated threshold scale: good matches
+        sit around 0.9+ instead of 0.5+). `downscale` matches on a reduced
+        copy of screen and template and scales the hits back up, cutting
+        the slide work quadratically.
+        """
         if template is None:
             return []
-        
-        # Convert both to grayscale for better matching
-        screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-        
-        # Template matching
-        result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        
-        # Find locations where the match exceeds threshold
-        locations = np.where(result >= threshold)
-        
-        matches = []
+
+        # Convert both to grayscale for better matching; callers that hold
+        # a precomputed template_gray (load_templates builds them) skip
+        # the template conversion entirely
+        screen_gray = self._get_screen_gray(screen)
+        if template_gray is None:
+            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+
+        if downscale != 1.0:
+            screen_gray = cv2.resize(screen_gray, None, fx=downscale, fy=downscale,
+                                     interpolation=cv2.INTER_AREA)
+            template_gray = cv2.resize(template_gray, None, fx=downscale, fy=downscale,
+                                       interpolation=cv2.INTER_AREA)
+
+        # Template matching - large templates go through FFT correlation,
+        # which turns the O(H*W*h*w) slide into a few full-frame FFTs
+        if template_gray.size >= self.FFT_TEMPLATE_AREA:
+            result = self._ccorr_normed_fft(screen_gray, template_gray)
+        else:
+            result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCORR_NORMED)
         h, w = template_gray.shape
-        
-        for pt in zip(*locations[::-1]):  # Switch x and y coordinates
-            x, y = pt
-            confidence = result[y, x]
+
+        # Non-maximum suppression: a real match lights up a cluster of
+        # neighbouring positions; keep only the local maxima within a
+        # template-sized neighbourhood so each instance yields one hit
+        local_max = cv2.dilate(result, np.ones((max(1, h // 2), max(1, w // 2)), np.float32))
+        ys, xs = np.where((result >= threshold) & (result >= local_max))
+        confs = result[ys, xs]
+
+        matches = []
+        inv = 1.0 / downscale
+        sw, sh = int(w * inv), int(h * inv)
+
+        # tolist() converts everything to plain Python scalars in one C
+        # pass - far cheaper than boxing numpy scalars element by element
+        for x, y, confidence in zip(xs.tolist(), ys.tolist(), confs.tolist()):
+            x, y = int(x * inv), int(y * inv)
             matches.append({
                 'x': x,
                 'y': y,
-                'w': w,
-                'h': h,
-                'center_x': x + w // 2,
-                'center_y': y + h // 2,
+                'w': sw,
+                'h': sh,
+                'center_x': x + sw // 2,
+                'center_y': y + sh // 2,
                 'confidence': confidence
             })
-        
+
         return matches
     
+    @staticmethod
+    def _ccorr_normed_fft(screen_gray: np.ndarray, template_gray: np.ndarray) -> np.ndarray:
+        """TM_CCORR_NORMED result map computed via FFT correlation
+
+        Numerically equivalent to cv2.matchTemplate with TM_CCORR_NORMED,
+        so the thresholds and NMS downstream stay calibrated. Numerator is
+        the raw cross-correlation via rfft2/irfft2; denominator is the
+        per-window energy from an integral image times the template norm.
+        """
+        h, w = template_gray.shape
+        H, W = screen_gray.shape
+
+        t = template_gray.astype(np.float32)
+        padded = np.zeros((H, W), dtype=np.float32)
+        padded[:h, :w] = t
+        corr = np.fft.irfft2(
+            np.fft.rfft2(screen_gray.astype(np.float32)) * np.conj(np.fft.rfft2(padded)),
+            s=(H, W))
+        corr = corr[:H - h + 1, :W - w + 1]
+
+        _, sq = cv2.integral2(screen_gray)
+        win_sq = (sq[h:H + 1, w:W + 1] - sq[:H - h + 1, w:W + 1]
+                  - sq[h:H + 1, :W - w + 1] + sq[:H - h + 1, :W - w + 1])
+        tmpl_norm = float(np.sqrt((t * t).sum()))
+        denom = np.sqrt(np.maximum(win_sq, 1e-6)) * max(tmpl_norm, 1e-6)
+        return (corr / denom).astype(np.float32)
+
+    def _mask_buf(self, role: str, shape: tuple) -> np.ndarray:
+        """Zeroed reusable uint8 mask buffer for the given role and shape
+
+        The returned buffer is owned by the detector and overwritten on the
+        next call with the same role/shape - valid for the current frame.
+        """
+        key = (role, shape)
+        buf = self._mask_bufs.get(key)
+        if buf is None:
+            buf = np.zeros(shape, dtype=np.uint8)
+            self._mask_bufs[key] = buf
+        else:
+            buf.fill(0)
+        return buf
+
+    def _get_screen_gray(self, screen: np.ndarray) -> np.ndarray:
+        """Grayscale view of the screen, converted once per frame
+
+        Keyed on buffer address, shape and a strided pixel digest - the
+        capture layer reuses frame buffers, so the address alone cannot
+        identify a frame.
+        """
+        key = (screen.ctypes.data, screen.shape, int(screen[::64, ::64].sum()))
+        if self._screen_gray_key != key:
+            # Reuse the persistent buffer when shapes line up - no fresh
+            # screen-sized allocation per frame
+            if (self._screen_gray is not None
+                    and self._screen_gray.shape == screen.shape[:2]):
+                cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY, dst=self._screen_gray)
+            else:
+                self._screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
+            self._screen_gray_key = key
+        return self._screen_gray
+
+    def _get_screen_hsv(self, screen: np.ndarray) -> np.ndarray:
+        """HSV view of the screen, converted once per frame
+
+        Same content keying as _get_screen_gray - see there for why the
+        buffer address alone is not enough.
+        """
+        key = (screen.ctypes.data, screen.shape, int(screen[::64, ::64].sum()))
+        if self._screen_hsv_key != key:
+            if (self._screen_hsv is not None
+                    and self._screen_hsv.shape == screen.shape):
+                cv2.cvtColor(screen, cv2.COLOR_BGR2HSV, dst=self._screen_hsv)
+            else:
+                self._screen_hsv = cv2.cvtColor(screen, cv2.COLOR_BGR2HSV)
+            self._screen_hsv_key = key
+        return self._screen_hsv
+
     def get_centroid(self, contour: np.ndarray) -> Tuple[Optional[int], Optional[int]]:
         """Calculate the centroid of a contour"""
         M = cv2.moments(contour)
@@ -77,32 +236,71 @@ class SoilDetector:
             return cx, cy
         return None, None
     
-    def detect_wheat(self, screen: np.ndarray) -> np.ndarray:
-        """Detect grown wheat areas using HSV color detection for coverage calculation"""
-        # Convert to HSV for better color detection
-        hsv = cv2.cvtColor(screen, cv2.COLOR_BGR2HSV)
-        
-        # Optimized HSV range for bright yellow/golden wheat (based on actual sampling)
-        lower_wheat = np.array([15, 100, 150])  # Broad yellow range
-        upper_wheat = np.array([35, 255, 255])  # Covers golden to bright yellow
-        
-        # Create mask for wheat
-        mask = cv2.inRange(hsv, lower_wheat, upper_wheat)
-        
-        # Apply morphological operations to clean up the mask
-        kernel = np.ones((5, 5), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        
-        # Filter out small noise - only keep significant wheat areas
+    def detect_wheat(self, screen: np.ndarray,
+                     hsv: Optional[np.ndarray] = None) -> np.ndarray:
+        """Detect grown wheat areas using HSV color detection for coverage calculation
+
+        Pass `hsv` when the caller already converted this frame (detect_field
+        does) to skip the full-frame cvtColor.
+        """
+        return self._wheat_mask(screen, self.config.WHEAT_MIN_AREA, hsv=hsv)
+
+    def detect_soil_by_hsv(self, hsv: np.ndarray) -> np.ndarray:
+        """Bare-soil mask from an already-converted HSV frame
+
+        Cheap complement to the template path: one inRange over the HSV
+        image detect_field has already computed for the wheat pass.
+        """
+        return cv2.inRange(hsv, self._soil_lower, self._soil_upper)
+
+    def detect_wheat_small(self, screen: np.ndarray) -> np.ndarray:
+        """Wheat mask at half resolution for scale-invariant measurements
+
+        The coverage ratio doesn't change under downscaling, so the HSV
+        conversion, range check and morphology all run on a quarter of the
+        pixels. Only callers that need pixel-accurate contours (field
+        detection) should use the full-resolution detect_wheat.
+        """
+        small = cv2.resize(screen, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        # Areas shrink 4x at half resolution
+        return self._wheat_mask(small, self.config.WHEAT_MIN_AREA // 4)
+
+    def _wheat_mask(self, bgr: np.ndarray, min_area: float,
+                    hsv: Optional[np.ndarray] = None) -> np.ndarray:
+        """Shared HSV wheat segmentation pipeline"""
+        if self._use_opencl:
+            # T-API path: the whole segment runs on the OpenCL device and
+            # only the final mask is downloaded for findContours
+            if hsv is not None:
+                hsv_u = cv2.UMat(hsv)
+            else:
+                hsv_u = cv2.cvtColor(cv2.UMat(bgr), cv2.COLOR_BGR2HSV)
+            mask_u = cv2.inRange(hsv_u, self._wheat_lower, self._wheat_upper)
+            mask_u = cv2.morphologyEx(mask_u, cv2.MORPH_CLOSE, self._morph_kernel)
+            mask_u = cv2.morphologyEx(mask_u, cv2.MORPH_OPEN, self._morph_kernel)
+            mask = mask_u.get()
+        else:
+            # Convert to HSV for better color detection
+            if hsv is None:
+                hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+
+            # Create mask for wheat
+            mask = cv2.inRange(hsv, self._wheat_lower, self._wheat_upper)
+
+            # Apply morphological operations to clean up the mask, writing in
+            # place - no intermediate mask allocations between the passes
+            cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._morph_kernel, dst=mask)
+            cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._morph_kernel, dst=mask)
+
+        # Filter out small noise - only keep significant wheat areas,
+        # filled in a single drawContours call instead of one fillPoly
+        # round trip per contour
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        filtered_mask = np.zeros_like(mask)
-        
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > self.config.WHEAT_MIN_AREA:
-                cv2.fillPoly(filtered_mask, [contour], 255)
-        
+        filtered_mask = self._mask_buf('wheat_filtered', mask.shape)
+        big_contours = [c for c in contours if cv2.contourArea(c) > min_area]
+        if big_contours:
+            cv2.drawContours(filtered_mask, big_contours, -1, 255, thickness=cv2.FILLED)
+
         return filtered_mask
     
     def count_wheat_coverage(self, screen: np.ndarray, field_contour: Optional[np.ndarray]) -> float:
@@ -110,20 +308,42 @@ class SoilDetector:
         if field_contour is None:
             return 0.0
         
-        wheat_mask = self.detect_wheat(screen)
+        # Localize to the field's bounding box first - everything outside
+        # it is zero in the field mask anyway, so the HSV pipeline has no
+        # business touching those pixels
+        x, y, w, h = cv2.boundingRect(field_contour)
+        pad = 8
+        x0, y0 = max(x - pad, 0), max(y - pad, 0)
+        x1 = min(x + w + pad, screen.shape[1])
+        y1 = min(y + h + pad, screen.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            return 0.0
+
+        # Coverage is a ratio, so the half-resolution mask measures it just
+        # as well at a quarter of the pixel work
+        wheat_mask = self.detect_wheat_small(screen[y0:y1, x0:x1])
         if wheat_mask is None:
             return 0.0
+
+        # Create field mask from contour, translated into the ROI and
+        # scaled to the half-res mask. The contour is canonical int32
+        # (N, 1, 2) from detect_field, so the arithmetic yields a
+        # contiguous array fillPoly uses as-is
+        field_mask = self._mask_buf('field', wheat_mask.shape)
+        cv2.fillPoly(field_mask, [(field_contour - (x0, y0)) // 2], 255)
         
-        # Create field mask from contour
-        field_mask = np.zeros(wheat_mask.shape, dtype=np.uint8)
-        cv2.fillPoly(field_mask, [field_contour.reshape(-1, 1, 2)], 255)
-        
-        # Find wheat within field boundaries only
-        wheat_in_field = cv2.bitwise_and(wheat_mask, field_mask)
-        
-        # Calculate areas in pixels
-        field_area_pixels = np.sum(field_mask > 0)
-        wheat_area_pixels = np.sum(wheat_in_field > 0)
+        if NUMBA_AVAILABLE:
+            # Fused parallel kernel: both counts in a single pass with no
+            # intersection mask allocated
+            field_area_pixels, wheat_area_pixels = coverage_counts(wheat_mask, field_mask)
+        else:
+            # Find wheat within field boundaries only
+            wheat_in_field = cv2.bitwise_and(wheat_mask, field_mask)
+
+            # Calculate areas in pixels - countNonZero runs one SIMD pass with
+            # no boolean temporary (the masks are already {0, 255} uint8)
+            field_area_pixels = cv2.countNonZero(field_mask)
+            wheat_area_pixels = cv2.countNonZero(wheat_in_field)
         
         # Prevent division by zero and ensure valid calculation
         if field_area_pixels > 0:
@@ -139,26 +359,76 @@ class SoilDetector:
         coverage = self.count_wheat_coverage(screen, field_contour)
         return coverage >= threshold
     
+    def _farm_probe(self, screen: np.ndarray) -> bool:
+        """Cheap check that the frame plausibly shows the farm at all
+
+        Counts wheat-yellow pixels on a 64x36 preview and, failing that,
+        probes the field template at 1/8 scale. Roughly 2300 pixels of
+        work against skipping the full matching + segmentation pipeline
+        on market, newspaper and loading screens.
+        """
+        small = cv2.resize(screen, (64, 36), interpolation=cv2.INTER_AREA)
+        hsv_small = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        yellow = cv2.countNonZero(cv2.inRange(hsv_small, self._wheat_lower, self._wheat_upper))
+        if yellow >= 5:
+            return True
+
+        if self.field_template is None:
+            return False
+
+        probe = self._probe_template
+        if probe is None:
+            template_gray = self.field_template_gray
+            if template_gray is None:
+                template_gray = cv2.cvtColor(self.field_template, cv2.COLOR_BGR2GRAY)
+            probe = cv2.resize(template_gray, None, fx=0.125, fy=0.125,
+                               interpolation=cv2.INTER_AREA)
+            self._probe_template = probe
+
+        screen_small = cv2.resize(self._get_screen_gray(screen), None, fx=0.125, fy=0.125,
+                                  interpolation=cv2.INTER_AREA)
+        if probe.shape[0] > screen_small.shape[0] or probe.shape[1] > screen_small.shape[1]:
+            return True
+
+        # TM_CCOEFF_NORMED for the probe - unlike the CCORR variant used
+        # for real matching it stays near zero on unrelated screens, so a
+        # low maxVal is a reliable "not the farm" signal
+        result = cv2.matchTemplate(screen_small, probe, cv2.TM_CCOEFF_NORMED)
+        return cv2.minMaxLoc(result)[1] >= 0.3
+
     def detect_field(self, screen: np.ndarray) -> Tuple[Optional[int], Optional[int], Optional[np.ndarray]]:
         """Main method to detect field using PNG template detection"""
-        # Find field template matches (empty soil)
-        field_matches = self.find_template_matches(screen, self.field_template, threshold=0.5)
-        
+        # Short-circuit on frames that clearly aren't the farm - the full
+        # pipeline below would only grind through them to return None
+        if not self._farm_probe(screen):
+            return None, None, None
+
+        # One full-frame HSV conversion shared by the wheat segmentation
+        # (and the soil fallback) below
+        hsv = self._get_screen_hsv(screen)
+
+        # Find field template matches (empty soil) - coarse pass at half
+        # resolution, accurate enough for a template this large
+        field_matches = self.find_template_matches(screen, self.field_template,
+                                                   threshold=0.9, downscale=0.5,
+                                                   template_gray=self.field_template_gray)
+
         # Use HSV detection for wheat (for coverage calculation only)
-        wheat_mask = self.detect_wheat(screen)
-        wheat_contours, _ = cv2.findContours(wheat_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        wheat_areas = [cv2.contourArea(c) for c in wheat_contours if cv2.contourArea(c) > self.config.WHEAT_MIN_AREA]
-        
-        # Detection results obtained
-        
+        wheat_mask = self.detect_wheat(screen, hsv=hsv)
+
         # Create combined mask
-        mask = np.zeros((screen.shape[0], screen.shape[1]), dtype=np.uint8)
-        
+        mask = self._mask_buf('combined', (screen.shape[0], screen.shape[1]))
+
         # Add field template matches
         for match in field_matches:
             x, y, w, h = match['x'], match['y'], match['w'], match['h']
             cv2.rectangle(mask, (x, y), (x + w, y + h), 255, -1)
-        
+
+        if self.field_template is None:
+            # No template to match against - fall back to finding the bare
+            # soil by its brown HSV signature on the shared conversion
+            mask = cv2.bitwise_or(mask, self.detect_soil_by_hsv(hsv), dst=mask)
+
         # Add wheat areas
         mask = cv2.bitwise_or(mask, wheat_mask)
         
@@ -178,6 +448,10 @@ class SoilDetector:
         
         if min_area < area < max_area:
             cx, cy = self.get_centroid(largest_contour)
+            # Canonicalize to int32 C-contiguous (N, 1, 2) once here -
+            # downstream fillPoly/drawContours consumers otherwise copy the
+            # contour internally on every frame
+            largest_contour = np.ascontiguousarray(largest_contour, dtype=np.int32)
             return cx, cy, largest_contour
         else:
-            return None, None, None 
\ No newline at end of file
+            return None, None, None
\ No newline at end of file
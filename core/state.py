@@ -5,24 +5,39 @@ This module contains dataclasses and state management utilities
 that encapsulate the bot's operational state and detection data.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Optional, Tuple
-import numpy as np
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Annotation-only: importing numpy here would make this lightweight
+    # state module pay the full numpy import on bot startup
+    import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionState:
     """Encapsulates detection state data"""
     screen: Optional[np.ndarray] = None
     center: Optional[Tuple[int, int]] = None
     contour: Optional[np.ndarray] = None
+    # Derived contour geometry, refreshed by the detector alongside the
+    # contour so path generation never recomputes bounds or rasterizes
+    contour_bbox: Optional[Tuple[int, int, int, int]] = None
+    contour_mask: Optional[np.ndarray] = None
     wheat_coverage: float = 0
     is_wheat_ready: bool = False
     storage_full: bool = False
     storage_keyword: Optional[str] = None
+    # Immutable (center, contour, contour_bbox, contour_mask,
+    # wheat_coverage, is_wheat_ready) tuple, rebound in one assignment by
+    # the detection thread. Attribute rebinding is atomic in CPython, so
+    # readers that only need a consistent view take this without the lock.
+    snapshot: tuple = (None, None, None, None, 0.0, False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BotState:
     """Encapsulates bot state data"""
     running: bool = False
@@ -2,16 +2,25 @@
 GUI module for HayDay Bot
 
 This package contains GUI components and visual interface elements.
+Submodules are imported lazily - `from gui import BotController` only
+pays for bot_controller's import chain, not the whole GUI stack.
 """
 
-from .main_window import HayDayBotGUI
-from .detection_manager import DetectionManager
-from .visual_display import VisualDisplay
-from .bot_controller import BotController
+_LAZY_IMPORTS = {
+    'HayDayBotGUI': 'gui.main_window',
+    'DetectionManager': 'gui.detection_manager',
+    'VisualDisplay': 'gui.visual_display',
+    'BotController': 'gui.bot_controller',
+}
 
-__all__ = [
-    'HayDayBotGUI',
-    'DetectionManager', 
-    'VisualDisplay',
-    'BotController'
-] 
\ No newline at end of file
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
@@ -42,11 +42,41 @@ class BotController:
         # Initialize market operations
         self.market_operations = MarketOperations(
             config, screen_capture, template_manager, bot_state,
-            log_callback, self.bot_operations.safe_click
+            log_callback, self.bot_operations.safe_click,
+            self.bot_operations.safe_click_burst
         )
         
         # Bot thread
         self.bot_thread: Optional[threading.Thread] = None
+
+        # One-entry cache for the last location analysis - several steps
+        # of a single cycle re-analyze the same captured frame
+        self._loc_cache: Optional[dict] = None
+        self._loc_batch: Optional[dict] = None
+        self._loc_cache_key: Optional[tuple] = None
+
+        # One-entry per-frame cache for the planting check - the retry
+        # loop and bot_loop both ask about the same frame
+        self._planting_check: bool = False
+        self._planting_check_key: Optional[tuple] = None
+
+        # Wall-clock time of the last analysis that confirmed the main
+        # page; cleared by workflows that navigate away from it
+        self._on_main_since: Optional[float] = None
+
+        # Guards compound silo_is_full / wheat_sold_this_session
+        # mutations. Separate from detection_lock so the detection thread
+        # never stalls behind the market branch's critical sections
+        self._bot_state_lock = threading.Lock()
+
+        # State-specialized cycle body, swapped by the cycle functions
+        # themselves on phase transitions
+        self._current_cycle_fn: Callable[[np.ndarray], bool] = self._cycle_idle
+
+        # Gates per-iteration confidence printouts - the routine
+        # confirmations fire every cycle and their float formatting is
+        # wasted work unless someone is actually debugging thresholds
+        self.log_debug_enabled: bool = False
     
     def start_bot(self) -> bool:
         """Start the bot with improved thread management"""
@@ -60,6 +90,10 @@ class BotController:
         self.update_status("Bot Running", "green")
         self.log("🤖 Bot started! Beginning infinite farming cycle...")
         
+        # Pre-capture in the background so the bot thread never blocks on
+        # a grab - it always takes the latest produced frame
+        self.screen_capture.start_async()
+
         # Start bot thread with proper management
         if self.bot_thread is None or not self.bot_thread.is_alive():
             self.bot_thread = threading.Thread(target=self.bot_loop, daemon=True)
@@ -76,6 +110,7 @@ class BotController:
         self.stop_event.set()
         self.bot_state.running = False
         self.bot_state.path_execution_active = False  # Unlock any locked paths
+        self.screen_capture.stop_async()
         
         # Only try to join thread if we're not calling from within the bot thread itself
         if self.bot_thread and self.bot_thread.is_alive():
@@ -97,177 +132,294 @@ class BotController:
         self.log("⏹️ Bot stopped - All threads terminated")
     
     def bot_loop(self):
-        """NEW TEMPLATE-BASED MAIN BOT LOOP - follows exact specifications"""
+        """NEW TEMPLATE-BASED MAIN BOT LOOP - follows exact specifications
+
+        The per-cycle body is specialized by farm state: a cycle function
+        picked for the current phase runs only the checks that can matter
+        in that phase (growing wheat never needs the planting CV check,
+        an empty farm never needs the harvest check). Cycle functions swap
+        `self._current_cycle_fn` on state transitions; silo pressure
+        overrides whatever state is active.
+        """
         cycle_count = 0
-        
+        self._current_cycle_fn = self._cycle_idle
+
+        # Hoist the hot attribute chains out of the loop - each self.x.y
+        # is a pair of dict lookups repeated hundreds of times per session
+        log = self.log
+        get_screen = self._get_screen_with_loading_check
+        isleep = self.bot_operations.interruptible_sleep
+        stop_is_set = self.stop_event.is_set
+        bot_state = self.bot_state
+        cycle_pause = self.config.CYCLE_PAUSE
+
         try:
-            while self.bot_state.running and not self.stop_event.is_set():
-                
+            while bot_state.running and not stop_is_set():
+
                 cycle_count += 1
-                self.log(f"\n🔄 === TEMPLATE-BASED CYCLE {cycle_count} ===")
-                
+                log(f"\n🔄 === TEMPLATE-BASED CYCLE {cycle_count} ===")
+
                 # STEP 0: Capture screen and handle loading screens
-                screen = self._get_screen_with_loading_check()
-                if self.bot_operations.interruptible_sleep(1):  # Brief pause after loading check
+                screen = get_screen()
+                if isleep(1):  # Brief pause after loading check
                     break
-                
+
                 # STEP 0.5: Check for and handle unknown popups
                 if self._check_and_handle_unknown_popups(screen):
-                    self.log("✅ Unknown popup handled, refreshing screen")
-                    screen = self._get_screen_with_loading_check()
-                    if self.bot_operations.interruptible_sleep(1):
+                    log("✅ Unknown popup handled, refreshing screen")
+                    screen = get_screen()
+                    if isleep(1):
                         break
-                
-                # STEP 1: Check for silo full popup
-                silo_popup_detected = self.market_operations.check_silo_full_template(screen)
-                
-                # Check if silo is persistently full
-                with self.detection_lock:
-                    persistent_silo_full = self.bot_state.silo_is_full
-                    wheat_sold = self.bot_state.wheat_sold_this_session
-                
-                if silo_popup_detected:
-                    self.log("🏗️ Silo popup detected! Closing popup and checking persistent state...")
-                    if self.market_operations.close_silo_with_template(screen):
-                        self.log("✅ Silo popup closed")
-                        # Reset storage detection state but keep persistent silo state
-                        with self.detection_lock:
-                            self.detection_state.storage_full = False
-                            self.detection_state.storage_keyword = None
-                    else:
-                        self.log("❌ Failed to close silo popup")
-                        if self.bot_operations.interruptible_sleep(5):
-                            break
-                        continue
-                
-                # Check persistent silo full state
-                if persistent_silo_full and not wheat_sold:
-                    self.log("🏗️ SILO IS PERSISTENTLY FULL - must go to market first before planting!")
-                    self.log("📊 Wheat not yet sold this session - preventing planting until market visit")
-                    
-                    # Check for loading screen before market workflow
-                    screen = self.screen_capture.capture_screen(use_cache=False)
-                    if self._check_and_dismiss_loading_screen_with_click(screen):
-                        self.log("🔄 Loading screen dismissed before market workflow")
-                        screen = self.screen_capture.capture_screen(use_cache=False)
-                    
-                    # Go to market workflow to sell wheat
-                    if self._handle_market_workflow():
-                        self.log("✅ Market workflow completed - checking if we can clear silo state")
-                        # Only clear silo state if we actually posted wheat to market
-                        with self.detection_lock:
-                            if self.bot_state.wheat_sold_this_session:
-                                self.bot_state.silo_is_full = False
-                                self.bot_state.wheat_sold_this_session = False
-                                self.log("🔄 Silo state cleared - wheat was posted to market")
-                            else:
-                                self.log("⚠️ No wheat posted - keeping silo full state")
-                    else:
-                        self.log("❌ Market workflow failed - keeping silo full state")
-                    
-                    # FORCE return to main page after market workflow to prevent getting stuck
-                    self.log("🏠 Forcing return to main page after market workflow...")
-                    self._smart_return_to_main()
-                    continue
-                elif persistent_silo_full and wheat_sold:
-                    self.log("✅ Silo was full but wheat was posted - clearing silo state")
-                    with self.detection_lock:
-                        self.bot_state.silo_is_full = False
-                        self.bot_state.wheat_sold_this_session = False
-                
-                # STEP 2: Ensure we're on main page before field operations  
-                if not self._ensure_on_main_page():
-                    self.log("❌ Cannot ensure main page access, skipping cycle")
-                    if self.bot_operations.interruptible_sleep(10):
-                        break
-                    continue
-                
-                # STEP 3: Check if fields need planting ONLY when on main page
-                if self.bot_operations.check_fields_need_planting_cv(screen):
-                    self.log("🌱 Fields need planting, using comprehensive planting to ensure complete coverage...")
-                    
-                    # Use comprehensive planting method that retries until all fields are planted
-                    if self._comprehensive_field_planting():
-                        self.log("✅ All fields planted successfully with comprehensive method")
-                        # Wait for wheat to grow WITH PRODUCTIVE MARKET MANAGEMENT
-                        self.log(f"⏰ Wheat planted! Managing market during {self.config.WHEAT_HARVEST_TIME}s growth period...")
-                        
-                        self._smart_wait_with_market_management(self.config.WHEAT_HARVEST_TIME)
-                    else:
-                        self.log("❌ Comprehensive field planting failed after multiple attempts")
-                        if self.bot_operations.interruptible_sleep(10):
-                            break
-                        continue
-                
-                # STEP 4: Check if wheat is ready to harvest (ensure on main page)
-                if not self._ensure_on_main_page():
-                    self.log("❌ Cannot access main page for harvest, skipping...")
-                    if self.bot_operations.interruptible_sleep(5):
-                        break
-                    continue
-                
-                # Only check wheat/fields when definitely on main page
+
+                # Silo pressure overrides the current phase. The detection
+                # thread already scans the silo template every interval, so
+                # in steady state this is a flag read, not a template scan;
+                # with detection disabled, fall back to scanning each cycle
                 with self.detection_lock:
-                    cx, cy = self.detection_state.center if self.detection_state.center else (None, None)
-                    contour = self.detection_state.contour
-                    wheat_ready = self.detection_state.is_wheat_ready
-                    current_coverage = self.detection_state.wheat_coverage
-                
-                if cx and cy and contour is not None and wheat_ready and current_coverage > 30:
-                    self.log(f"🚜 Wheat is ready! Harvesting... (coverage: {current_coverage:.1f}%)")
-                    if self.bot_operations.harvest_wheat(cx, cy, contour):
-                        self.log("✅ Wheat harvested successfully")
-                    else:
-                        self.log("❌ Failed to harvest wheat")
-                        if self.bot_operations.interruptible_sleep(10):
-                            break
-                        continue
-                
-                # STEP 5: Check for collect button (sold items ready) - TEMPLATE DETECTION
-                screen = self._get_screen_with_loading_check()
-                
-                collect_x, collect_y, confidence = self.template_manager.find_template(screen, 'collect', threshold=self.config.COLLECT_BUTTON_THRESHOLD)
-                if collect_x and collect_y:
-                    self.log(f"💰 COLLECT BUTTON detected! Items sold, going to market... (confidence: {confidence:.2f})")
-                    if self._handle_market_workflow():
-                        self.log("✅ Market workflow completed successfully")
-                    else:
-                        self.log("❌ Market workflow failed")
-                        if self.bot_operations.interruptible_sleep(10):
-                            break
-                        continue
-                
-                # STEP 6: If no urgent actions needed, brief pause
-                self.log("😴 Cycle completed, waiting before next cycle...")
+                    storage_full = self.detection_state.storage_full
+                with self._bot_state_lock:
+                    persistent_silo_full = bot_state.silo_is_full
+                if (storage_full or persistent_silo_full or
+                        not bot_state.detection_active):
+                    self._current_cycle_fn = self._cycle_silo_full
+
+                if not self._current_cycle_fn(screen):
+                    break
+
+                # If no urgent actions needed, brief pause
+                log("😴 Cycle completed, waiting before next cycle...")
                 self.update_status("Waiting for next cycle...", "green")
-                if self.bot_operations.interruptible_sleep(self.config.CYCLE_PAUSE):
+                if isleep(cycle_pause):
                     break
-                
+
         except Exception as e:
             self.log(f"💥 Critical bot error: {e}")
             self.stop_bot()
-        
+
         self.log("🤖 Bot thread stopped")
+
+    def _cycle_silo_full(self, screen) -> bool:
+        """Cycle body while the silo is (or may be) full
+
+        Closes the popup, runs the market workflow until wheat is posted,
+        and clears the persistent state. Hands back to the full decision
+        cycle once the pressure is resolved.
+        """
+        # STEP 1: Check for silo full popup
+        silo_popup_detected = self.market_operations.check_silo_full_template(screen)
+
+        # Check if silo is persistently full
+        with self._bot_state_lock:
+            persistent_silo_full = self.bot_state.silo_is_full
+            wheat_sold = self.bot_state.wheat_sold_this_session
+
+        if silo_popup_detected:
+            self.log("🏗️ Silo popup detected! Closing popup and checking persistent state...")
+            if self.market_operations.close_silo_with_template(screen):
+                self.log("✅ Silo popup closed")
+                # Reset storage detection state but keep persistent silo state
+                with self.detection_lock:
+                    self.detection_state.storage_full = False
+                    self.detection_state.storage_keyword = None
+            else:
+                self.log("❌ Failed to close silo popup")
+                return not self.bot_operations.interruptible_sleep(5)
+
+        # Check persistent silo full state
+        if persistent_silo_full and not wheat_sold:
+            self.log("🏗️ SILO IS PERSISTENTLY FULL - must go to market first before planting!")
+            self.log("📊 Wheat not yet sold this session - preventing planting until market visit")
+
+            # Check for loading screen before market workflow
+            screen = self.screen_capture.capture_screen(use_cache=False)
+            if self._check_and_dismiss_loading_screen_with_click(screen):
+                self.log("🔄 Loading screen dismissed before market workflow")
+                screen = self.screen_capture.capture_screen(use_cache=False)
+
+            # Go to market workflow to sell wheat
+            if self._handle_market_workflow():
+                self.log("✅ Market workflow completed - checking if we can clear silo state")
+                # Only clear silo state if we actually posted wheat to market
+                with self._bot_state_lock:
+                    if self.bot_state.wheat_sold_this_session:
+                        self.bot_state.silo_is_full = False
+                        self.bot_state.wheat_sold_this_session = False
+                        self.log("🔄 Silo state cleared - wheat was posted to market")
+                    else:
+                        self.log("⚠️ No wheat posted - keeping silo full state")
+            else:
+                self.log("❌ Market workflow failed - keeping silo full state")
+
+            # FORCE return to main page after market workflow to prevent getting stuck
+            self.log("🏠 Forcing return to main page after market workflow...")
+            self._smart_return_to_main()
+            return True
+        elif persistent_silo_full and wheat_sold:
+            self.log("✅ Silo was full but wheat was posted - clearing silo state")
+            with self._bot_state_lock:
+                self.bot_state.silo_is_full = False
+                self.bot_state.wheat_sold_this_session = False
+
+        # Pressure resolved - run the full decision cycle on this frame
+        self._current_cycle_fn = self._cycle_idle
+        return self._cycle_idle(screen)
+
+    def _cycle_idle(self, screen) -> bool:
+        """Full decision cycle - startup and any state the bot can't assume
+
+        Runs the planting CV check every cycle and routes to the planting
+        or growing body accordingly. The specialized states converge back
+        here whenever an operation fails.
+        """
+        # STEP 2: Ensure we're on main page before field operations
+        if not self._ensure_on_main_page():
+            self.log("❌ Cannot ensure main page access, skipping cycle")
+            return not self.bot_operations.interruptible_sleep(10)
+
+        if self._fields_need_planting(screen):
+            self._current_cycle_fn = self._cycle_planting
+            return self._cycle_planting(screen)
+        return self._cycle_growing(screen)
+
+    def _cycle_planting(self, screen) -> bool:
+        """Cycle body when the fields are expected to be empty"""
+        # STEP 2: Ensure we're on main page before field operations
+        if not self._ensure_on_main_page():
+            self.log("❌ Cannot ensure main page access, skipping cycle")
+            return not self.bot_operations.interruptible_sleep(10)
+
+        # STEP 3: Check if fields need planting ONLY when on main page
+        # (memoized per frame, so re-entry from _cycle_idle costs nothing)
+        if not self._fields_need_planting(screen):
+            self._current_cycle_fn = self._cycle_idle
+            return True
+
+        self.log("🌱 Fields need planting, using comprehensive planting to ensure complete coverage...")
+
+        # Use comprehensive planting method that retries until all fields are planted
+        if self._comprehensive_field_planting():
+            self.log("✅ All fields planted successfully with comprehensive method")
+            # Wait for wheat to grow WITH PRODUCTIVE MARKET MANAGEMENT
+            self.log(f"⏰ Wheat planted! Managing market during {self.config.WHEAT_HARVEST_TIME}s growth period...")
+
+            self._smart_wait_with_market_management(self.config.WHEAT_HARVEST_TIME)
+            # Growth wait is done - watch for readiness, skip planting checks
+            self._current_cycle_fn = self._cycle_growing
+            return True
+
+        self.log("❌ Comprehensive field planting failed after multiple attempts")
+        self._current_cycle_fn = self._cycle_idle
+        return not self.bot_operations.interruptible_sleep(10)
+
+    def _cycle_growing(self, screen) -> bool:
+        """Cycle body while wheat is growing or ready for harvest
+
+        Skips the planting CV check entirely: only the lock-free snapshot
+        read and the collect-button scan run per cycle.
+        """
+        # STEP 4: Check if wheat is ready to harvest (ensure on main page)
+        if not self._ensure_on_main_page():
+            self.log("❌ Cannot access main page for harvest, skipping...")
+            return not self.bot_operations.interruptible_sleep(5)
+
+        # Only check wheat/fields when definitely on main page.
+        # Lock-free consistent read: the detection thread rebinds
+        # the snapshot tuple in a single atomic assignment
+        center, contour, _, _, current_coverage, wheat_ready = self.detection_state.snapshot
+        cx, cy = center if center else (None, None)
+
+        if cx and cy and contour is not None and wheat_ready and current_coverage > 30:
+            self.log(f"🚜 Wheat is ready! Harvesting... (coverage: {current_coverage:.1f}%)")
+            if self.bot_operations.harvest_wheat(cx, cy, contour):
+                self.log("✅ Wheat harvested successfully")
+                # Fields are clear again - plant on the next cycle
+                self._current_cycle_fn = self._cycle_planting
+            else:
+                self.log("❌ Failed to harvest wheat")
+                self._current_cycle_fn = self._cycle_idle
+                return not self.bot_operations.interruptible_sleep(10)
+
+        # STEP 5: Check for collect button (sold items ready) - TEMPLATE DETECTION
+        screen = self._get_screen_with_loading_check()
+
+        collect_x, collect_y, confidence = self._find_template(screen, 'collect', self.config.COLLECT_BUTTON_THRESHOLD)
+        if collect_x and collect_y:
+            self.log(f"💰 COLLECT BUTTON detected! Items sold, going to market... (confidence: {confidence:.2f})")
+            if self._handle_market_workflow():
+                self.log("✅ Market workflow completed successfully")
+            else:
+                self.log("❌ Market workflow failed")
+                return not self.bot_operations.interruptible_sleep(10)
+
+        return True
     
+    def _find_template(self, screen: np.ndarray, name: str, threshold: float):
+        """find_template with this template's config ROI hint applied
+
+        Buttons only ever appear in known screen regions; the fractional
+        boxes in BotConfig.ROI_HINTS restrict the matchTemplate scan to
+        that slice instead of the full frame.
+        """
+        return self.template_manager.find_template(
+            screen, name, threshold=threshold,
+            roi=self.config.ROI_HINTS.get(name))
+
+    def _fields_need_planting(self, screen: np.ndarray) -> bool:
+        """check_fields_need_planting_cv memoized per captured frame
+
+        Keyed the same way as the location cache; repeated checks against
+        one frame (pre-check, post-plant verify, final check) run the CV
+        pass once.
+        """
+        key = (screen.ctypes.data, screen.shape, int(screen[::64, ::64].sum()))
+        if self._planting_check_key == key:
+            return self._planting_check
+        result = self.bot_operations.check_fields_need_planting_cv(screen)
+        self._planting_check = result
+        self._planting_check_key = key
+        return result
+
+    def _get_fresh_screen(self, max_age: float = 0.15) -> np.ndarray:
+        """Screen capture that tolerates a just-taken grab
+
+        Used between market workflow steps: when the preceding step turned
+        out to be a no-op it reuses the last grab, and steps that clicked
+        invalidate the capture cache to force a real one.
+        """
+        return self.screen_capture.capture_screen(use_cache=True, max_age=max_age)
+
     def _get_screen_with_loading_check(self) -> np.ndarray:
-        """Capture screen and handle loading screens automatically with click escape"""
-        screen = self.screen_capture.capture_screen(use_cache=False)
+        """Capture screen and handle loading screens automatically with click escape
+
+        safe_click invalidates the capture cache, so reusing a recent
+        cached frame here is safe: it only happens when nothing has acted
+        on the UI since that frame was grabbed.
+        """
+        screen = self._get_fresh_screen()
         if self._check_and_dismiss_loading_screen_with_click(screen):
             self.log("🔄 Loading screen dismissed, refreshing capture...")
-            time.sleep(0.5)  # Brief wait for loading to complete
+            if self.stop_event.wait(0.5):  # Brief wait for loading to complete
+                return screen
             screen = self.screen_capture.capture_screen(use_cache=False)
         return screen
     
     def _ensure_on_main_page(self) -> bool:
         """Ensure we're on the main page before field operations"""
+        # Fast path: an analysis confirmed the main page moments ago and
+        # no workflow has navigated away since - skip the capture + scan
+        if (self._on_main_since is not None
+                and time.time() - self._on_main_since < 2.0):
+            return True
+
         max_attempts = 5
-        
+
         for attempt in range(max_attempts):
             screen = self.screen_capture.capture_screen(use_cache=False)
             locations = self._analyze_current_location(screen)
             
             if 'main' in locations:
-                self.log(f"✅ Confirmed on main page (confidence: {locations['main']:.3f})")
+                if self.log_debug_enabled:
+                    self.log(f"✅ Confirmed on main page (confidence: {locations['main']:.3f})")
                 return True
             
             self.log(f"⚠️ Not on main page (attempt {attempt+1}/{max_attempts}), attempting return...")
@@ -285,69 +437,106 @@ class BotController:
         return False
     
     def _analyze_current_location(self, screen: np.ndarray) -> dict:
-        """Analyze where we currently are and return location info with priority logic"""
-        return self.market_operations.analyze_current_location(screen)
+        """Analyze where we currently are and return location info with priority logic
+
+        Runs all location templates as one batched scan so the per-frame
+        preprocessing (grayscale, pyramid, FFT) is shared across them,
+        instead of up to six sequential full-frame passes. The result is
+        cached per frame (buffer address + shape + content digest, the
+        same keying the detectors use) so back-to-back analyses of one
+        capture cost a dict lookup.
+        """
+        key = (screen.ctypes.data, screen.shape, int(screen[::64, ::64].sum()))
+        if self._loc_cache_key == key:
+            return self._loc_cache
+
+        batch = self.market_operations.scan_location_templates(screen)
+        locations = self.market_operations.analyze_current_location(screen, batch=batch)
+        self._loc_cache = locations
+        self._loc_batch = batch
+        self._loc_cache_key = key
+        self._on_main_since = time.time() if 'main' in locations else None
+        return locations
     
+    def _last_close_match(self):
+        """Close-button hit from the most recent batched location scan
+
+        The scan already matched the close template; branches that need
+        its coordinates read them here instead of re-searching the frame.
+        """
+        if self._loc_batch is not None:
+            return self._loc_batch.get('close', (None, None, 0))
+        return None, None, 0
+
+    def _close_with_close_button(self, screen, label: str) -> bool:
+        """Click the close button found by the batched location scan"""
+        close_x, close_y, close_conf = self._last_close_match()
+        if close_x and close_y:
+            self.bot_operations.safe_click(close_x, close_y, label)
+            return True
+        return False
+
     def _smart_return_to_main(self) -> bool:
         """Smart return to main page with multiple strategies"""
         self.log("🔄 Attempting to return to main page...")
-        
+
+        # Priority-ordered exit handlers per detected location; each
+        # returns True once it acted on the UI. analyze_current_location
+        # reports at most one location, so one table walk replaces the
+        # old if-chain and its per-branch close-button re-searches.
+        handlers = [
+            ('silo_popup', "🏗️ Silo popup blocking return, closing...",
+             self.market_operations.close_silo_with_template),
+            ('offer', "📝 In offer page, closing...",
+             lambda s: self._close_with_close_button(s, "close offer page")),
+            ('market', "🏪 In market, closing...",
+             self.market_operations.close_market_template),
+            ('paper_page', "📰 In paper page, closing...",
+             lambda s: self._close_with_close_button(s, "close paper page")),
+            ('dialog_open', "🔲 Dialog open, closing...",
+             lambda s: self._close_with_close_button(s, "close dialog")),
+        ]
+
+        # Hoist the per-attempt attribute chains out of the retry loop
+        log = self.log
+        capture = self.screen_capture.capture_screen
+        analyze = self._analyze_current_location
+        stop_wait = self.stop_event.wait
+
         max_attempts = 10
         for attempt in range(max_attempts):
-            screen = self.screen_capture.capture_screen(use_cache=False)
-            locations = self._analyze_current_location(screen)
-            
+            screen = capture(use_cache=False)
+            locations = analyze(screen)
+
             if 'main' in locations:
-                self.log(f"✅ Successfully on main page (confidence: {locations['main']:.3f})")
+                if self.log_debug_enabled:
+                    log(f"✅ Successfully on main page (confidence: {locations['main']:.3f})")
                 return True
-            
-            # Handle different locations
-            if 'silo_popup' in locations:
-                self.log("🏗️ Silo popup blocking return, closing...")
-                if self.market_operations.close_silo_with_template(screen):
-                    time.sleep(0.5)
-                    continue
-            
-            if 'offer' in locations:
-                self.log("📝 In offer page, closing...")
-                close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
-                if close_x and close_y:
-                    self.bot_operations.safe_click(close_x, close_y, "close offer page")
-                    time.sleep(0.5)
-                    continue
-            
-            if 'market' in locations:
-                self.log("🏪 In market, closing...")
-                if self.market_operations.close_market_template(screen):
-                    time.sleep(0.5)
-                    continue
-            
-            if 'paper_page' in locations:
-                self.log("📰 In paper page, closing...")
-                close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
-                if close_x and close_y:
-                    self.bot_operations.safe_click(close_x, close_y, "close paper page")
-                    time.sleep(0.5)
-                    continue
-            
-            if 'dialog_open' in locations:
-                self.log("🔲 Dialog open, closing...")
-                close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
-                if close_x and close_y:
-                    self.bot_operations.safe_click(close_x, close_y, "close dialog")
-                    time.sleep(0.5)
-                    continue
-            
+
+            handled = False
+            for key, message, handler in handlers:
+                if key in locations:
+                    log(message)
+                    handled = handler(screen)
+                    break
+
+            if handled:
+                if stop_wait(0.5):
+                    return False
+                continue
+
             # If no specific location detected, wait and try again
-            self.log(f"❓ Unknown location (attempt {attempt+1}/{max_attempts}), waiting...")
-            time.sleep(1)
-        
+            log(f"❓ Unknown location (attempt {attempt+1}/{max_attempts}), waiting...")
+            if stop_wait(1):
+                return False
+
         self.log("❌ Could not return to main page after multiple attempts")
         return False
-    
+
     def _comprehensive_field_planting(self, max_attempts: int = 5) -> bool:
         """Comprehensive field planting that ensures all fields are properly planted"""
         self.log("🌱 Starting comprehensive field planting process...")
+        self._on_main_since = None  # planting drags may scroll the view
         
         for attempt in range(max_attempts):
             self.log(f"🔄 Planting attempt {attempt + 1}/{max_attempts}")
@@ -365,15 +554,13 @@ class BotController:
                 screen = self.screen_capture.capture_screen(use_cache=False)
             
             # Check if fields still need planting
-            if not self.bot_operations.check_fields_need_planting_cv(screen):
+            if not self._fields_need_planting(screen):
                 self.log("✅ All fields are sufficiently planted!")
                 return True
             
-            # Get current field detection data
-            with self.detection_lock:
-                cx, cy = self.detection_state.center if self.detection_state.center else (None, None)
-                contour = self.detection_state.contour
-                current_coverage = self.detection_state.wheat_coverage
+            # Get current field detection data - lock-free snapshot read
+            center, contour, _, _, current_coverage, _ = self.detection_state.snapshot
+            cx, cy = center if center else (None, None)
             
             if cx and cy and contour is not None:
                 self.log(f"🎯 Planting field at ({cx}, {cy}) with {current_coverage:.1f}% coverage")
@@ -387,12 +574,11 @@ class BotController:
                     
                     # Check if coverage improved significantly
                     screen = self.screen_capture.capture_screen(use_cache=False)
-                    if not self.bot_operations.check_fields_need_planting_cv(screen):
+                    if not self._fields_need_planting(screen):
                         self.log("✅ Field planting successful - all fields now planted!")
                         return True
                     else:
-                        with self.detection_lock:
-                            new_coverage = self.detection_state.wheat_coverage
+                        new_coverage = self.detection_state.snapshot[4]
                         improvement = new_coverage - current_coverage
                         if improvement > 10:  # At least 10% improvement
                             self.log(f"📈 Good progress: coverage improved by {improvement:.1f}%")
@@ -407,9 +593,8 @@ class BotController:
         
         # Final check after all attempts
         screen = self.screen_capture.capture_screen(use_cache=False)
-        if self.bot_operations.check_fields_need_planting_cv(screen):
-            with self.detection_lock:
-                final_coverage = self.detection_state.wheat_coverage
+        if self._fields_need_planting(screen):
+            final_coverage = self.detection_state.snapshot[4]
             self.log(f"⚠️ Field planting incomplete after {max_attempts} attempts (final coverage: {final_coverage:.1f}%)")
             return False
         else:
@@ -419,6 +604,7 @@ class BotController:
     def _handle_market_workflow(self) -> bool:
         """Complete market workflow using template-based approach with timeout"""
         self.log("🏪 Starting SIMPLE market workflow for silo full...")
+        self._on_main_since = None  # entering the market leaves the main page
         
         try:
             # Simple workflow: go to market, collect items, post wheat, check paper, and leave
@@ -428,25 +614,31 @@ class BotController:
             if not self.market_operations.go_to_market_template(screen):
                 self.log("❌ Failed to enter market")
                 return False
-            
+            self.screen_capture.invalidate_cache()  # market UI replaced the farm view
+
+            # Steps below only re-grab when the previous step actually
+            # changed the UI; no-op steps share the last capture
             # Step 2: Collect sold items (simple)
-            screen = self.screen_capture.capture_screen(use_cache=False)
-            self.market_operations.collect_sold_items_template(screen)
-            
+            screen = self._get_fresh_screen()
+            if self.market_operations.collect_sold_items_template(screen):
+                self.screen_capture.invalidate_cache()
+
             # Step 3: Fill market with wheat (simple)
-            screen = self.screen_capture.capture_screen(use_cache=False)
-            self.market_operations.fill_market_with_wheat_template(screen)
-            
+            screen = self._get_fresh_screen()
+            if self.market_operations.fill_market_with_wheat_template(screen):
+                self.screen_capture.invalidate_cache()
+
             # Step 4: Check paper (simple - don't get stuck)
-            screen = self.screen_capture.capture_screen(use_cache=False)
+            screen = self._get_fresh_screen()
             self.log("📰 Checking for advertisement paper (simple)...")
             try:
-                self.market_operations.check_and_create_advertisement(screen)
+                if self.market_operations.check_and_create_advertisement(screen):
+                    self.screen_capture.invalidate_cache()
             except Exception as paper_error:
                 self.log(f"⚠️ Paper check failed, continuing: {paper_error}")
-            
+
             # Step 5: Close market and return
-            screen = self.screen_capture.capture_screen(use_cache=False)
+            screen = self._get_fresh_screen()
             self.market_operations.close_market_template(screen)
             
             self.log("✅ SIMPLE market workflow completed")
@@ -463,103 +655,127 @@ class BotController:
             self.log("📈 Market management disabled, using simple wait...")
             start_time = time.time()
             while time.time() - start_time < total_wait_seconds:
-                if not self.bot_state.running or self.stop_event.is_set():
+                if not self.bot_state.running:
                     break
                 elapsed = int(time.time() - start_time)
                 self.update_status(f"Growing wheat... {elapsed}s/{total_wait_seconds}s", "blue")
-                if self.bot_operations.interruptible_sleep(10):
+                # Block in the kernel until stop or the next status tick,
+                # without overshooting the end of the growth window
+                if self.stop_event.wait(min(10, total_wait_seconds - elapsed)):
                     break
             return
         
         self.log("📈 Starting intelligent wait with market management...")
-        
+
         start_time = time.time()
         last_market_check = 0
         market_check_interval = self.config.MARKET_CHECK_INTERVAL
-        
+
+        # Hoist the hot attribute chains out of the wait loop
+        log = self.log
+        update_status = self.update_status
+        stop_wait = self.stop_event.wait
+        stop_is_set = self.stop_event.is_set
+        bot_state = self.bot_state
+        capture = self.screen_capture.capture_screen
+        market_ops = self.market_operations
+        find = self._find_template
+        thr_collect = self.config.COLLECT_BUTTON_THRESHOLD
+        thr_new_offer = self.config.NEW_OFFER_THRESHOLD
+
         while time.time() - start_time < total_wait_seconds:
-            if not self.bot_state.running or self.stop_event.is_set():
+            if not bot_state.running or stop_is_set():
                 break
-            
+
             elapsed = int(time.time() - start_time)
             remaining = total_wait_seconds - elapsed
-            
+
             # Update status
-            self.update_status(f"Growing wheat... {elapsed}s/{total_wait_seconds}s (Managing market)", "blue")
-            
+            update_status(f"Growing wheat... {elapsed}s/{total_wait_seconds}s (Managing market)", "blue")
+
             # Check if it's time for market management
             if elapsed - last_market_check >= market_check_interval:
-                self.log(f"🏪 Market check #{elapsed//market_check_interval} - {remaining}s remaining for wheat growth")
-                
+                log(f"🏪 Market check #{elapsed//market_check_interval} - {remaining}s remaining for wheat growth")
+
                 try:
                     # Capture screen for market checks
-                    screen = self.screen_capture.capture_screen(use_cache=False)
-                    
+                    screen = capture(use_cache=False)
+
                     # Check if we have a collect button (items sold)
-                    collect_x, collect_y, confidence = self.template_manager.find_template(screen, 'collect', threshold=self.config.COLLECT_BUTTON_THRESHOLD)
+                    collect_x, collect_y, confidence = find(screen, 'collect', thr_collect)
                     if collect_x and collect_y:
-                        self.log(f"💰 COLLECT button found during growth! Collecting sold items... (confidence: {confidence:.2f})")
-                        self.market_operations.handle_market_workflow_template()
-                        self.log("✅ Market management completed, resuming wheat growth wait")
+                        log(f"💰 COLLECT button found during growth! Collecting sold items... (confidence: {confidence:.2f})")
+                        market_ops.handle_market_workflow_template()
+                        log("✅ Market management completed, resuming wheat growth wait")
                     else:
                         # No urgent items to collect, check if market needs filling
                         # Check if market needs more offers
                         
                         # Go to market to check for available slots
-                        if self.market_operations.go_to_market_template(screen):
+                        if market_ops.go_to_market_template(screen):
                             time.sleep(0.6)  # Wait for market UI to load
-                            screen = self.screen_capture.capture_screen(use_cache=False)
-                            
-                            in_market, market_confidence = self.market_operations.is_in_market(screen)
+                            screen = capture(use_cache=False)
+
+                            in_market, market_confidence = market_ops.is_in_market(screen)
                             if not in_market:
-                                self.log(f"⚠️ Market didn't load properly (confidence: {market_confidence:.3f}), skipping")
+                                log(f"⚠️ Market didn't load properly (confidence: {market_confidence:.3f}), skipping")
                                 continue
-                            
-                            self.log(f"✅ In market (confidence: {market_confidence:.3f}), managing offers...")
-                            
+
+                            if self.log_debug_enabled:
+                                log(f"✅ In market (confidence: {market_confidence:.3f}), managing offers...")
+
                             # Collect sold items first
-                            collected_something = self.market_operations.collect_sold_items_template(screen)
+                            collected_something = market_ops.collect_sold_items_template(screen)
                             if collected_something:
-                                screen = self.screen_capture.capture_screen(use_cache=False)
-                            
+                                self.screen_capture.invalidate_cache()
+                                screen = self._get_fresh_screen()
+
                             # Check for new offer slots
-                            offer_x, offer_y, conf = self.template_manager.find_template(screen, 'new_offer', threshold=self.config.NEW_OFFER_THRESHOLD)
+                            offer_x, offer_y, conf = find(screen, 'new_offer', thr_new_offer)
                             if offer_x and offer_y:
-                                self.log(f"📝 Found empty slots, filling... (confidence: {conf:.2f})")
-                                self.market_operations.fill_market_with_wheat_template(screen)
-                                self.log("✅ Market slots filled during growth period")
+                                log(f"📝 Found empty slots, filling... (confidence: {conf:.2f})")
+                                if market_ops.fill_market_with_wheat_template(screen):
+                                    self.screen_capture.invalidate_cache()
+                                log("✅ Market slots filled during growth period")
+                            else:
+                                log("✅ Market is full")
+
+                            # Check for advertisement paper - shares the
+                            # last grab unless the fill step clicked
+                            screen = self._get_fresh_screen()
+                            if market_ops.check_and_create_advertisement(screen):
+                                self.screen_capture.invalidate_cache()
                             else:
-                                self.log("✅ Market is full")
-                            
-                            # Check for advertisement paper
-                            screen = self.screen_capture.capture_screen(use_cache=False)
-                            if not self.market_operations.check_and_create_advertisement(screen):
-                                self.log("⚠️ Advertisement creation not needed")
-                            
+                                log("⚠️ Advertisement creation not needed")
+
                             # Close market
-                            screen = self.screen_capture.capture_screen(use_cache=False)
-                            self.market_operations.close_market_template(screen)
+                            screen = self._get_fresh_screen()
+                            market_ops.close_market_template(screen)
                         else:
-                            self.log("⚠️ Could not access market during growth period")
-                    
+                            log("⚠️ Could not access market during growth period")
+
                 except Exception as e:
-                    self.log(f"⚠️ Error during market management: {e}")
-                
+                    log(f"⚠️ Error during market management: {e}")
+
                 last_market_check = elapsed
-            
-            # Sleep for a short period before next check
-            if self.bot_operations.interruptible_sleep(5):  # Check every 5 seconds for responsive control
+
+            # One kernel wait until the next market check, the end of the
+            # growth window or the 5s status refresh, whichever comes
+            # first - stop_event.wait returns immediately on stop
+            now = time.time() - start_time
+            sleep_for = min(last_market_check + market_check_interval - now,
+                            total_wait_seconds - now, 5)
+            if sleep_for > 0 and stop_wait(sleep_for):
                 break
         
         self.log(f"✅ Growth period completed! Wheat should be ready for harvest after {total_wait_seconds}s")
     
     def _check_and_handle_unknown_popups(self, screen: np.ndarray) -> bool:
         """Check for and handle unknown popups using close button detection"""
-        # Look for close button that might indicate an unknown popup
-        close_x, close_y, close_conf = self.template_manager.find_template(screen, 'close', threshold=self.config.CLOSE_BUTTON_THRESHOLD)
-        
-        # Only handle if we're not in a known location and there's a close button
+        # The batched location scan already matches the close template;
+        # analyze first and read the close hit from the same pass
         locations = self._analyze_current_location(screen)
+        close_x, close_y, close_conf = self._last_close_match()
         
         # If we detect a close button but we're not in any known location, it might be an unknown popup
         if close_x and close_y and not locations:
@@ -572,7 +788,7 @@ class BotController:
     
     def _check_and_dismiss_loading_screen(self, screen: np.ndarray) -> bool:
         """Check for and dismiss loading screens"""
-        loading_x, loading_y, confidence = self.template_manager.find_template(screen, 'loading', threshold=0.7)
+        loading_x, loading_y, confidence = self._find_template(screen, 'loading', 0.7)
         if loading_x and loading_y:
             self.log(f"🔄 Loading screen detected (confidence: {confidence:.2f}), waiting...")
             time.sleep(2)
@@ -582,13 +798,13 @@ class BotController:
     def _check_and_dismiss_loading_screen_with_click(self, screen: np.ndarray) -> bool:
         """Check for loading screens and try to dismiss them with click template"""
         # First check for loading screen
-        loading_x, loading_y, loading_conf = self.template_manager.find_template(screen, 'loading', threshold=self.config.LOADING_SCREEN_THRESHOLD)
+        loading_x, loading_y, loading_conf = self._find_template(screen, 'loading', self.config.LOADING_SCREEN_THRESHOLD)
         
         if loading_x and loading_y:
             self.log(f"🔄 Loading screen detected (confidence: {loading_conf:.2f})")
             
             # Look for click template to escape loading screen
-            click_x, click_y, click_conf = self.template_manager.find_template(screen, 'click', threshold=self.config.CLICK_ESCAPE_THRESHOLD)
+            click_x, click_y, click_conf = self._find_template(screen, 'click', self.config.CLICK_ESCAPE_THRESHOLD)
             
             if click_x and click_y:
                 self.log(f"🖱️ Found click escape point (confidence: {click_conf:.2f}), clicking to dismiss loading...")
@@ -5,12 +5,13 @@ This module handles the detection loop, field detection, and visual updates.
 """
 
 import time
+import queue
 import threading
 import numpy as np
 from typing import Optional, Callable
 
 from core import DetectionState, BotState, ScreenCapture, TemplateManager
-from core import SoilDetector
+from core import SoilDetector, PathGenerator
 from config import BotConfig
 
 
@@ -35,7 +36,36 @@ class DetectionManager:
         self.log = log_callback
         self.update_detection_status = update_detection_status_callback
         self.update_storage_status = update_storage_status_callback
-    
+        # Latest-frame hand-off to the GUI renderer. One slot, drop-old:
+        # the detection thread never blocks on resize/PIL/Tk work and the
+        # Tk event loop consumes at its own pace
+        self.render_slot: "queue.Queue" = queue.Queue(maxsize=1)
+        # Overlay publishes are rate-capped independently of the
+        # detection cadence - animating the overlay faster than
+        # VISUAL_UPDATE_INTERVAL is wasted resize/PIL/Tk work
+        self._last_visual_ts = 0.0
+
+    def _queue_render(self, screen, cx, cy, contour):
+        """Publish the latest frame for the GUI render tick, dropping any
+        unconsumed older frame. Publishes are throttled to the configured
+        visual rate."""
+        now = time.monotonic()
+        if now - self._last_visual_ts < self.config.VISUAL_UPDATE_INTERVAL:
+            return
+        self._last_visual_ts = now
+        snap = (screen, cx, cy, contour)
+        try:
+            self.render_slot.put_nowait(snap)
+        except queue.Full:
+            try:
+                self.render_slot.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.render_slot.put_nowait(snap)
+            except queue.Full:
+                pass
+
     def detection_loop(self, visual_display=None):
         """Continuous detection loop - always runs visual updates"""
         while not self.stop_event.is_set():
@@ -46,13 +76,17 @@ class DetectionManager:
                     if not self.bot_state.path_execution_active:
                         self._capture_and_detect(visual_display)
                     else:
-                        # During path execution, still update visual with current screen
-                        if visual_display:
+                        # During path execution, still update visual with
+                        # current screen - but only at the visual rate, so
+                        # the capture itself is skipped between publishes
+                        if (visual_display and
+                                time.monotonic() - self._last_visual_ts >=
+                                self.config.VISUAL_UPDATE_INTERVAL):
                             screen = self.screen_capture.capture_screen(use_cache=True)
                             with self.detection_lock:
                                 cx, cy = self.detection_state.center if self.detection_state.center else (None, None)
                                 contour = self.detection_state.contour
-                            visual_display.update_display(screen, cx, cy, contour)
+                            self._queue_render(screen, cx, cy, contour)
                 else:
                     # When detection is disabled, show disabled message
                     if visual_display:
@@ -70,23 +104,23 @@ class DetectionManager:
         self.log("🔍 Detection thread stopped")
     
     def _interruptible_sleep(self, total_time: float) -> bool:
-        """Sleep for given time but check for stop signal periodically"""
-        elapsed = 0
-        chunk_size = min(self.config.STOP_CHECK_INTERVAL, self.config.MAX_SLEEP_CHUNK)
-        
-        while elapsed < total_time and not self.stop_event.is_set():
-            sleep_time = min(chunk_size, total_time - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
-            
-        return self.stop_event.is_set()
+        """Sleep for given time, waking immediately on the stop signal
+
+        Event.wait returns as soon as the event is set, so one kernel
+        wait replaces the old chunked sleep-and-poll loop.
+        """
+        return self.stop_event.wait(total_time)
     
     def _capture_and_detect(self, visual_display=None):
         """Capture screen and run detection with optimized caching"""
         try:
-            # Use cached screen capture
-            screen = self.screen_capture.capture_screen(use_cache=True)
-            
+            # Use cached screen capture. The returned frame aliases one of
+            # the capture's rotating buffers and is overwritten two grabs
+            # later - detection holds it through coverage and readiness
+            # analysis and then publishes it in the shared state, so take
+            # our own copy up front.
+            screen = self.screen_capture.capture_screen(use_cache=True).copy()
+
             # Run detection
             cx, cy, contour = self.soil_detector.detect_field(screen)
             
@@ -97,24 +131,41 @@ class DetectionManager:
                 wheat_coverage = self.soil_detector.count_wheat_coverage(screen, contour)
                 is_ready = self.soil_detector.is_ready_for_harvest(screen, contour)
             
-            # Check for storage full popup - ONLY check for silo.png template
-            silo_x, silo_y, confidence = self.template_manager.find_template(screen, 'silo', threshold=0.6)
+            # Check for storage full popup - ONLY check for silo.png template.
+            # The popup is always centered, so the ROI hint keeps the scan
+            # off the screen borders
+            silo_x, silo_y, confidence = self.template_manager.find_template(
+                screen, 'silo', threshold=0.6,
+                roi=self.config.ROI_HINTS.get('silo'))
             storage_full = silo_x is not None and silo_y is not None
             storage_keyword = "SILO_TEMPLATE_DETECTED" if storage_full else None
             
+            # Derive contour geometry here, outside the lock - planting and
+            # harvesting read it from the state instead of recomputing
+            contour_bbox = contour_mask = None
+            if contour is not None:
+                contour_bbox, contour_mask = PathGenerator.contour_geometry(contour)
+
             # Thread-safe update of shared data
             with self.detection_lock:
                 self.detection_state.screen = screen
                 self.detection_state.center = (cx, cy) if cx is not None else None
                 self.detection_state.contour = contour
+                self.detection_state.contour_bbox = contour_bbox
+                self.detection_state.contour_mask = contour_mask
                 self.detection_state.wheat_coverage = wheat_coverage
                 self.detection_state.is_wheat_ready = is_ready
                 self.detection_state.storage_full = storage_full
                 self.detection_state.storage_keyword = storage_keyword
+                # One-shot snapshot for lock-free readers
+                self.detection_state.snapshot = (
+                    self.detection_state.center, contour, contour_bbox,
+                    contour_mask, wheat_coverage, is_ready)
             
-            # Always update visual display when detection is active
+            # Always update visual display when detection is active -
+            # publish for the GUI render tick instead of rendering here
             if visual_display:
-                visual_display.update_display(screen, cx, cy, contour)
+                self._queue_render(screen, cx, cy, contour)
                 
             # Update status
             self.update_detection_status(cx, cy)
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
+import queue
 from typing import Optional
 
 from core import DetectionState, BotState, ScreenCapture, TemplateManager
@@ -52,9 +53,29 @@ class HayDayBotGUI:
         
         # Threads
         self.detection_thread: Optional[threading.Thread] = None
-        
+
+        # Hotkey handles returned by keyboard.add_hotkey, removed
+        # individually on shutdown
+        self.registered_hotkeys: list = []
+
+        # Deferred logging: bot/detection threads only enqueue raw messages,
+        # the Tk event loop drains and formats them in batches so hot loops
+        # never pay for string formatting or per-message `after` scheduling
+        self._log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Widget line count tracked locally - querying the Text index
+        # walks the whole buffer, the counter is free
+        self._log_line_count: int = 0
+        # Status throttle state - suppress identical updates within 500ms
+        self._last_status_text: str = ""
+        self._last_status_time: float = 0.0
+        # Latest pending status values, coalesced by the drain tick -
+        # worker threads write here instead of scheduling Tk events
+        self._status_lock = threading.Lock()
+        self._pending_status: dict = {}
+
         # Setup modern GUI
         self._setup_modern_gui()
+        self.root.after(100, self._drain_log_queue)
         self._initialize_systems()
         self._setup_keyboard_shortcuts()
         
@@ -239,7 +260,20 @@ class HayDayBotGUI:
         
         # Start detection
         self._start_detection_thread()
+        # Consume published frames at ~30fps on the Tk event loop; the
+        # detection thread only fills the one-slot queue
+        self.root.after(33, self._render_tick)
         self.log("✅ All systems ready!")
+
+    def _render_tick(self):
+        """Render the newest published detection frame, if any"""
+        try:
+            screen, cx, cy, contour = self.detection_manager.render_slot.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.visual_display.update_display(screen, cx, cy, contour)
+        self.root.after(33, self._render_tick)
     
     def _detect_screen_resolution(self) -> str:
         """Detect screen resolution"""
@@ -258,10 +292,14 @@ class HayDayBotGUI:
         if not KEYBOARD_AVAILABLE:
             self.log("⚠️ Keyboard shortcuts not available")
             return
-            
+
         try:
-            keyboard.add_hotkey(self.config.START_BOT_HOTKEY, self._hotkey_start_bot)
-            keyboard.add_hotkey(self.config.STOP_BOT_HOTKEY, self._hotkey_stop_bot)
+            # Keep the returned handles so shutdown can remove exactly
+            # these hotkeys instead of sweeping the library's global state
+            self.registered_hotkeys.append(
+                keyboard.add_hotkey(self.config.START_BOT_HOTKEY, self._hotkey_start_bot))
+            self.registered_hotkeys.append(
+                keyboard.add_hotkey(self.config.STOP_BOT_HOTKEY, self._hotkey_stop_bot))
             self.log(f"⌨️ Hotkeys: {self.config.START_BOT_HOTKEY} = Start, {self.config.STOP_BOT_HOTKEY} = Stop")
         except Exception as e:
             self.log(f"⚠️ Could not setup hotkeys: {e}")
@@ -314,33 +352,22 @@ class HayDayBotGUI:
         self.main_status.config(text="Bot stopped")
     
     def update_status(self, status: str, color: str = "black"):
-        """Update status label"""
-        self.root.after(0, lambda: self.main_status.config(text=status))
-        if "running" in status.lower():
-            self.root.after(0, lambda: self._update_status_indicator("running"))
-        elif "stopped" in status.lower():
-            self.root.after(0, lambda: self._update_status_indicator("stopped"))
-    
+        """Update status label (throttled - Tk widget updates are expensive)"""
+        now = time.time()
+        if status == self._last_status_text and now - self._last_status_time < 0.5:
+            return
+        self._last_status_text = status
+        self._last_status_time = now
+        with self._status_lock:
+            self._pending_status['main'] = status
+
     def _update_detection_status(self, cx: Optional[int], cy: Optional[int]):
         """Update detection status"""
-        if cx is not None and cy is not None:
-            self.root.after(0, lambda: self.detection_status.config(
-                text="✅ Field detected", style='Status.TLabel'
-            ))
-            self.root.after(0, lambda: self.field_status.config(
-                text=f"Center: ({cx}, {cy})"
-            ))
-            if self.visual_display:
-                screen = self.screen_capture.capture_screen()
-                with self.detection_lock:
-                    contour = self.detection_state.contour
-                self.visual_display.update_display(screen, cx, cy, contour)
-        else:
-            self.root.after(0, lambda: self.detection_status.config(
-                text="❌ No field found", style='Error.TLabel'
-            ))
-            self.root.after(0, lambda: self.field_status.config(text="Center: None"))
-    
+        with self._status_lock:
+            self._pending_status['detection'] = (cx, cy)
+        # The detection tick already published this frame to the
+        # render slot - no need to capture and render a second time
+
     def _update_storage_status(self):
         """Update storage status"""
         with self.detection_lock:
@@ -350,23 +377,72 @@ class HayDayBotGUI:
             else:
                 status_text = "✅ Storage OK"
                 style = 'Status.TLabel'
-        
-        self.root.after(0, lambda: self.storage_status.config(text=status_text, style=style))
+
+        with self._status_lock:
+            self._pending_status['storage'] = (status_text, style)
+
+    def _apply_pending_status(self):
+        """Apply the latest coalesced status values to the widgets"""
+        with self._status_lock:
+            if not self._pending_status:
+                return
+            pending, self._pending_status = self._pending_status, {}
+
+        if 'main' in pending:
+            status = pending['main']
+            self.main_status.config(text=status)
+            if "running" in status.lower():
+                self._update_status_indicator("running")
+            elif "stopped" in status.lower():
+                self._update_status_indicator("stopped")
+
+        if 'detection' in pending:
+            cx, cy = pending['detection']
+            if cx is not None and cy is not None:
+                self.detection_status.config(text="✅ Field detected", style='Status.TLabel')
+                self.field_status.config(text=f"Center: ({cx}, {cy})")
+            else:
+                self.detection_status.config(text="❌ No field found", style='Error.TLabel')
+                self.field_status.config(text="Center: None")
+
+        if 'storage' in pending:
+            status_text, style = pending['storage']
+            self.storage_status.config(text=status_text, style=style)
     
     def log(self, message: str):
-        """Add message to log"""
-        self.root.after(0, lambda: self._update_log(message))
-    
-    def _update_log(self, message: str):
-        """Update log text widget"""
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, formatted_message)
-        self.log_text.see(tk.END)
-        
-        # Keep log size manageable
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > 5000:
-            self.log_text.delete('1.0', '100.0')
+        """Add message to log (thread-safe, non-blocking)"""
+        self._log_queue.put((time.time(), message))
+
+    def _drain_log_queue(self):
+        """Flush queued log messages and pending status updates in one batch
+
+        Runs on the Tk event loop every 100ms. Formatting and widget
+        updates happen here instead of on the bot thread, and a burst of
+        messages costs a single insert instead of one `after` call each.
+        """
+        self._apply_pending_status()
+
+        chunks = []
+        try:
+            while True:
+                when, message = self._log_queue.get_nowait()
+                timestamp = time.strftime("%H:%M:%S", time.localtime(when))
+                chunks.append(f"[{timestamp}] {message}\n")
+        except queue.Empty:
+            pass
+
+        if chunks:
+            self.log_text.insert(tk.END, ''.join(chunks))
+            self.log_text.see(tk.END)
+
+            # Ring-buffer pruning: once full, drop exactly the overflow
+            # from the top instead of shuffling 100 lines at a time.
+            # The tracked counter avoids a Tk index round-trip per drain
+            self._log_line_count += sum(c.count('\n') for c in chunks)
+            if self._log_line_count > 5000:
+                excess = self._log_line_count - 5000
+                self.log_text.delete('1.0', f'{excess + 1}.0')
+                self._log_line_count = 5000
+
+        self.root.after(100, self._drain_log_queue)
  
\ No newline at end of file
@@ -32,40 +32,73 @@ class VisualDisplay:
         )
         self.canvas.pack(expand=True, pady=(0, 10))
         
-        # Remove duplicate status indicators - field detection and center info 
+        # Remove duplicate status indicators - field detection and center info
         # are already shown in the main window's detection status section
-        
+
+        # Persistent Tk image: one PhotoImage pasted into per frame
+        # instead of a new Tcl image object + canvas item every update
+        self._photo: Optional[ImageTk.PhotoImage] = None
+        self._photo_size: Optional[tuple] = None
+
+        # Last scaled contour, keyed on (contour fingerprint, scale) -
+        # between detection updates the same contour is redrawn many
+        # times and rescaling it each frame is wasted allocation
+        self._scaled_contour_key: Optional[tuple] = None
+        self._scaled_contour: Optional[np.ndarray] = None
+
+        # Last generated preview path - regeneration only makes sense
+        # when the detected center or contour actually moved
+        self._path_cache_key: Optional[tuple] = None
+        self._path_cache: Optional[list] = None
+
+        # Display geometry and resize output, computed once per source
+        # resolution - the screen size never changes mid-session
+        self._src_shape: Optional[tuple] = None
+        self._out_size: Optional[tuple] = None
+        self._resize_buf: Optional[np.ndarray] = None
+
         # Show initial message
         self.show_waiting_message()
-    
+
     def show_waiting_message(self):
         """Show clean waiting message"""
         self.canvas.delete("all")
+        self._photo = None
         self.canvas.create_text(
-            300, 200, text="🔍 Detection Starting...\n\nPosition HayDay field clearly on screen", 
+            300, 200, text="🔍 Detection Starting...\n\nPosition HayDay field clearly on screen",
             fill="#ecf0f1", font=("Arial", 12), justify=tk.CENTER
         )
-    
+
     def show_disabled_message(self):
         """Show disabled message"""
         self.canvas.delete("all")
+        self._photo = None
         self.canvas.create_text(
-            300, 200, text="👁️ Detection Disabled", 
+            300, 200, text="👁️ Detection Disabled",
             fill="#95a5a6", font=("Arial", 14)
         )
     
     def update_display(self, screen: np.ndarray, cx: Optional[int], cy: Optional[int], contour: Optional[np.ndarray]):
         """Update display with clean detection overlay"""
         try:
-            # Resize for display
+            # Display geometry is fixed per source resolution - compute it
+            # on the first frame and keep a preallocated output buffer
             height, width = screen.shape[:2]
-            display_width = 600
-            display_height = int((display_width / width) * height)
-            if display_height > 400:
-                display_height = 400
-                display_width = int((display_height / height) * width)
-            
-            display_img = cv2.resize(screen, (display_width, display_height))
+            if self._src_shape != (height, width):
+                display_width = 600
+                display_height = int((display_width / width) * height)
+                if display_height > 400:
+                    display_height = 400
+                    display_width = int((display_height / height) * width)
+                self._src_shape = (height, width)
+                self._out_size = (display_width, display_height)
+                self._resize_buf = np.empty((display_height, display_width, 3),
+                                            dtype=np.uint8)
+            display_width, display_height = self._out_size
+
+            # INTER_AREA is the right downsampler and writes in place
+            display_img = cv2.resize(screen, self._out_size, dst=self._resize_buf,
+                                     interpolation=cv2.INTER_AREA)
             
             # Draw detection overlay
             if cx is not None and cy is not None:
@@ -99,10 +132,8 @@ class VisualDisplay:
         
         # Draw field boundary if available
         if contour is not None:
-            scaled_contour = contour.copy()
-            scaled_contour[:, :, 0] = (scaled_contour[:, :, 0] * scale_x).astype(int)
-            scaled_contour[:, :, 1] = (scaled_contour[:, :, 1] * scale_y).astype(int)
-            cv2.drawContours(display_img, [scaled_contour], -1, (52, 152, 219), 2)
+            cv2.drawContours(display_img, [self._scale_contour(contour, scale_x, scale_y)],
+                             -1, (52, 152, 219), 2)
         
         # Draw UI positions (minimal)
         self._draw_ui_positions(display_img, display_cx, display_cy, scale_x, scale_y)
@@ -111,7 +142,29 @@ class VisualDisplay:
         if self.show_path_var.get():
             self._draw_simple_path(display_img, display_cx, display_cy, contour, scale_x, scale_y)
     
-    def _draw_ui_positions(self, display_img: np.ndarray, display_cx: int, display_cy: int, 
+    @staticmethod
+    def _contour_fingerprint(contour: np.ndarray) -> tuple:
+        """Cheap identity for a contour - shape plus corner samples"""
+        return (contour.shape, int(contour[0, 0, 0]), int(contour[0, 0, 1]),
+                int(contour[-1, 0, 0]), int(contour[-1, 0, 1]))
+
+    def _scale_contour(self, contour: np.ndarray, scale_x: float, scale_y: float) -> np.ndarray:
+        """Scale the field contour to display coordinates, memoized
+
+        One vectorized multiply replaces the per-axis copy/astype churn,
+        and the result is reused until the contour or window scale
+        actually changes.
+        """
+        key = (self._contour_fingerprint(contour), scale_x, scale_y)
+        if key != self._scaled_contour_key:
+            scale = np.array([scale_x, scale_y], dtype=np.float32)
+            self._scaled_contour = (
+                contour.reshape(-1, 2).astype(np.float32) * scale
+            ).astype(np.int32).reshape(contour.shape)
+            self._scaled_contour_key = key
+        return self._scaled_contour
+
+    def _draw_ui_positions(self, display_img: np.ndarray, display_cx: int, display_cy: int,
                           scale_x: float, scale_y: float):
         """Draw clean UI element indicators"""
         # Wheat position
@@ -138,22 +191,34 @@ class VisualDisplay:
         try:
             original_cx = int(display_cx / scale_x)
             original_cy = int(display_cy / scale_y)
+
+            # Generate path - memoized on (center, contour); the overlay
+            # redraws far more often than detection actually moves them
+            key = (original_cx, original_cy,
+                   None if contour is None else self._contour_fingerprint(contour))
+            if key != self._path_cache_key:
+                self._path_cache = PathGenerator.create_linear_path(
+                    original_cx, original_cy, contour, "plant")
+                self._path_cache_key = key
+            path = self._path_cache
             
-            # Generate path
-            path = PathGenerator.create_linear_path(original_cx, original_cy, contour, "plant")
-            
-            # Draw simplified path (every 10th point)
-            prev_point = None
-            for i, (x, y) in enumerate(path[::10]):  # Every 10th point for cleaner look
-                scaled_x = int(x * scale_x)
-                scaled_y = int(y * scale_y)
-                
-                if 0 <= scaled_x < display_img.shape[1] and 0 <= scaled_y < display_img.shape[0]:
-                    if prev_point is not None:
-                        cv2.line(display_img, prev_point, (scaled_x, scaled_y), (155, 89, 182), 1)
-                    
-                    cv2.circle(display_img, (scaled_x, scaled_y), 2, (155, 89, 182), -1)
-                    prev_point = (scaled_x, scaled_y)
+            # Draw simplified path (every 10th point) - scale and clip all
+            # points at once, then one polylines call instead of a
+            # Python-level line+circle pair per point
+            pts = np.asarray(path[::10], dtype=np.float32)
+            pts *= np.array([scale_x, scale_y], dtype=np.float32)
+            pts = pts.astype(np.int32)
+
+            h, w = display_img.shape[:2]
+            in_bounds = ((pts[:, 0] >= 0) & (pts[:, 0] < w) &
+                         (pts[:, 1] >= 0) & (pts[:, 1] < h))
+            pts = pts[in_bounds]
+
+            if len(pts):
+                cv2.polylines(display_img, [pts.reshape(-1, 1, 2)],
+                              False, (155, 89, 182), 1)
+                # Point markers in one fancy-indexed write
+                display_img[pts[:, 1], pts[:, 0]] = (155, 89, 182)
             
             # Path info
             cv2.putText(display_img, f"Path: {len(path)} points", 
@@ -162,16 +227,23 @@ class VisualDisplay:
             pass
     
     def _update_canvas(self, display_img: np.ndarray):
-        """Update canvas with image"""
+        """Update canvas by pasting into a persistent PhotoImage
+
+        Creating a fresh PhotoImage plus canvas item per frame churns
+        Tcl object handles and reallocates the whole display buffer;
+        pasting into one long-lived image only copies pixels.
+        """
         try:
-            # Convert to PIL and then to PhotoImage
             img_rgb = cv2.cvtColor(display_img, cv2.COLOR_BGR2RGB)
             pil_img = Image.fromarray(img_rgb)
-            photo = ImageTk.PhotoImage(pil_img)
-            
-            # Update canvas
-            self.canvas.delete("all")
-            self.canvas.create_image(300, 200, image=photo)
-            self.canvas.image = photo  # Keep reference
+
+            size = (display_img.shape[1], display_img.shape[0])
+            if self._photo is None or self._photo_size != size:
+                self._photo = ImageTk.PhotoImage(pil_img)
+                self._photo_size = size
+                self.canvas.delete("all")
+                self.canvas.create_image(300, 200, image=self._photo)
+            else:
+                self._photo.paste(pil_img)
         except Exception:
             pass 
\ No newline at end of file
@@ -8,7 +8,7 @@ echo [1/4] Checking Python installation...
 python --version >nul 2>&1
 if errorlevel 1 (
     echo ERROR: Python is not installed or not in PATH
-    echo Please install Python 3.7+ from https://python.org
+    echo Please install Python 3.10+ from https://python.org
     echo Make sure to check "Add Python to PATH" during installation
     pause
     exit /b 1
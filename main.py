@@ -4,77 +4,176 @@ Lightweight automated farming bot with modern GUI
 """
 
 import tkinter as tk
-import time
+from tkinter import messagebox
+from functools import partial
+import signal
 import sys
 import os
+import traceback
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# Tkinter's mainloop polls Tcl every 20ms by default while idle; the GUI
+# here only needs its 33/100ms ticks, so a longer busy-wait interval cuts
+# wakeups that would otherwise compete with the capture threads. Newer
+# interpreters without the busy-wait path simply lack the setter.
 try:
-    from gui import HayDayBotGUI
-    from config import BotConfig
-except ImportError as e:
-    print(f"❌ Import error: {e}")
+    import _tkinter
+    _tkinter.setbusywaitinterval(100)
+except (ImportError, AttributeError):
+    pass
+
+# Make the bot's modules importable. When run as `python main.py` the
+# script directory is already first on sys.path, so only append when a
+# host embedded us - and append, not prepend, so every stdlib import
+# done by the gui graph doesn't stat this directory first
+# __file__ is already absolute on modern interpreters; only fall back
+# to abspath (getcwd + normpath) when a host passed a relative path.
+# Frozen builds (PyInstaller sets sys.frozen) configure sys.path
+# themselves - touching it there just adds a directory scan per import
+if not getattr(sys, 'frozen', False):
+    _here = os.path.dirname(__file__) or '.'
+    if not os.path.isabs(_here):
+        _here = os.path.abspath(_here)
+    if _here not in sys.path:
+        sys.path.append(_here)
+
+# Pre-check the bot's own modules with find_spec so the friendly error
+# doesn't need a try/except around the actual imports
+import importlib.util
+_missing = [m for m in ('gui', 'config') if importlib.util.find_spec(m) is None]
+if _missing:
+    print(f"❌ Import error: missing module(s): {', '.join(_missing)}")
     print("Make sure all required modules are available.")
     sys.exit(1)
 
-try:
-    import keyboard
+# The gui package re-exports its classes lazily, so this import is
+# near-free; cv2/numpy/mss only load when HayDayBotGUI is first touched,
+# after the Tk window is already on screen
+import gui
+from config import BotConfig
+
+# Importing keyboard installs its low-level OS hook, which blocks for
+# several milliseconds - load it on a background thread so the work
+# overlaps Tk window construction, and join before the GUI registers
+# hotkeys
+import threading
+
+keyboard = None
+KEYBOARD_AVAILABLE = False
+
+
+def _load_keyboard():
+    global keyboard, KEYBOARD_AVAILABLE
+    try:
+        import keyboard as _keyboard
+    except ImportError:
+        return
+    keyboard = _keyboard
     KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
+
+
+_keyboard_thread = threading.Thread(target=_load_keyboard, daemon=True)
+_keyboard_thread.start()
+
+# Banner prints are pointless (and not free) when stdout is a dead pipe,
+# as under pythonw or a frozen build launched from Explorer
+try:
+    _QUIET = sys.stdout is None or not sys.stdout.isatty()
+except Exception:
+    _QUIET = True
+
+# Built once at import - the banner rule doesn't need a multiply per run
+_BANNER = "=" * 40
+
+
+def _safe(fn):
+    """Run one cleanup step; a failing step must not block shutdown"""
+    try:
+        fn()
+    except Exception:
+        pass
+
+
+def _remove_hotkeys(app):
+    if KEYBOARD_AVAILABLE:
+        # Remove only the hotkeys we installed - the global sweep
+        # walks every registered hook under the library's lock
+        for handle in getattr(app, 'registered_hotkeys', []):
+            keyboard.remove_hotkey(handle)
+
+
+def _release_capture(app):
+    sc = getattr(app, 'screen_capture', None)
+    if sc is not None:
+        sc.cleanup()
+
+
+def _on_closing(app, root):
+    """Window close handler"""
+    if app.bot_state.running:
+        if messagebox.askokcancel("Quit", "Bot is running. Stop and quit?"):
+            app.stop_bot()
+            # Let the event loop keep servicing events while the
+            # bot threads wind down instead of blocking in sleep
+            root.after(500, root.destroy)
+    else:
+        # Clean up resources safely - one shared guard instead of an
+        # inline try/except block per step
+        for step in (_remove_hotkeys, _release_capture):
+            _safe(partial(step, app))
+
+        root.destroy()
 
 
 def main():
     """Main application entry point"""
-    print("🤖 HayDay Bot - Clean & Fast")
-    print("=" * 40)
+    if not _QUIET:
+        print("🤖 HayDay Bot - Clean & Fast")
+        print(_BANNER)
     
-    # Create main window
+    # Create main window and paint it before the heavy imports run -
+    # the user sees the window while cv2/numpy load
     root = tk.Tk()
-    
+    root.update_idletasks()
+    root.update()
+
     try:
-        # Initialize the bot GUI
-        app = HayDayBotGUI(root)
-        
-        # Window close handler
-        def on_closing():
-            if app.bot_state.running:
-                if tk.messagebox.askokcancel("Quit", "Bot is running. Stop and quit?"):
-                    app.stop_bot()
-                    time.sleep(0.5)
-                    root.destroy()
-            else:
-                # Clean up resources safely
-                try:
-                    if KEYBOARD_AVAILABLE:
-                        keyboard.clear_all_hotkeys()
-                except Exception:
-                    pass
-                
-                try:
-                    if hasattr(app, 'screen_capture'):
-                        app.screen_capture.cleanup()
-                except Exception:
-                    pass
-                
-                root.destroy()
+        # The GUI registers hotkeys during init - make sure the
+        # background keyboard import has finished first
+        _keyboard_thread.join()
+
+        # Initialize the bot GUI (first touch pulls in the CV stack)
+        app = gui.HayDayBotGUI(root)
         
-        root.protocol("WM_DELETE_WINDOW", on_closing)
+        # Flat handler bound with partial - no closure keeping the whole
+        # main() frame alive for the lifetime of the window
+        close = partial(_on_closing, app, root)
+        root.protocol("WM_DELETE_WINDOW", close)
+
+        # Ctrl+C in the launching terminal goes through the same clean
+        # close path. Tk only notices pending signals when control
+        # returns to Python, so keep a light periodic tick alive
+        try:
+            signal.signal(signal.SIGINT, lambda *_: root.after(0, close))
+        except ValueError:
+            pass  # not on the main thread (embedded launch)
+
+        def _signal_tick():
+            root.after(200, _signal_tick)
+        root.after(200, _signal_tick)
         
         # Start the application
-        print("✅ Bot initialized successfully")
-        print("🚀 Starting GUI...")
+        if not _QUIET:
+            print("✅ Bot initialized successfully")
+            print("🚀 Starting GUI...")
         root.mainloop()
         
     except Exception as e:
         print(f"❌ Failed to start: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
     
-    print("👋 HayDay Bot closed")
+    if not _QUIET:
+        print("👋 HayDay Bot closed")
 
 
 if __name__ == "__main__":